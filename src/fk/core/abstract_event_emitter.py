@@ -96,15 +96,16 @@ class AbstractEventEmitter:
             params['event'] = event
             if carry is not None:
                 params['carry'] = carry
+            is_debug = logger.isEnabledFor(logging.DEBUG)   # Check it once, as this is called very often
             for callback in self._connections_1[event]:
-                if logger.isEnabledFor(logging.DEBUG):
+                if is_debug:
                     logger.debug(f' ! {_callback_display(callback)}(' + str(params) + ')')
                 self._callback_invoker(callback, **params)
             for callback in self._connections_2[event]:
-                if logger.isEnabledFor(logging.DEBUG):
+                if is_debug:
                     logger.debug(f' ! {_callback_display(callback)}(' + str(params) + ')')
                 self._callback_invoker(callback, **params)
-            if logger.isEnabledFor(logging.DEBUG):
+            if is_debug:
                 logger.debug(' > ' + self.__class__.__name__ + '._emit(' + event + ')')
 
     def _is_muted(self) -> bool:
@@ -294,6 +294,10 @@ class AbstractSettings(AbstractEventEmitter, ABC):
         # Note that there's no default value -- we can get it from self._defaults
         pass
 
+    def get_bool(self, name: str) -> bool:
+        # Boolean settings are stored as 'True' / 'False' strings
+        return self.get(name) == 'True'
+
     @abstractmethod
     def clear(self) -> None:
         pass
@@ -310,7 +314,7 @@ class AbstractSettings(AbstractEventEmitter, ABC):
             return self.get('WebsocketEventSource.username')
 
     def is_team_supported(self) -> bool:
-        return self.get('Source.type') != 'local' and self.get('Application.enable_teams') == 'True'
+        return self.get('Source.type') != 'local' and self.get_bool('Application.enable_teams')
 
     def is_remote_source(self) -> bool:
         return self.get('Source.type') in ('websocket', 'flowkeeper.org', 'flowkeeper.pro')
@@ -17,6 +17,7 @@ import datetime
 
 from fk.core.abstract_data_container import AbstractDataContainer
 from fk.core.abstract_settings import AbstractSettings
+from fk.core.events import AfterSettingsChanged
 from fk.core.user import User
 
 ADMIN_USER = 'admin@local.host'
@@ -27,6 +28,8 @@ class Tenant(AbstractDataContainer[User, None]):
     It contains users and has no parent."""
 
     _settings: AbstractSettings
+    _current_user: User | None
+    _non_system_users: tuple[User, ...] | None
 
     def __init__(self, settings: AbstractSettings):
         super().__init__('Flowkeeper Desktop Client',
@@ -34,6 +37,9 @@ class Tenant(AbstractDataContainer[User, None]):
                          '0',
                          datetime.datetime.now(datetime.timezone.utc))
         self._settings = settings
+        self._current_user = None
+        self._non_system_users = None
+        settings.on(AfterSettingsChanged, self._on_setting_changed)
         self[ADMIN_USER] = User(
             self,
             ADMIN_USER,
@@ -48,5 +54,30 @@ class Tenant(AbstractDataContainer[User, None]):
     def get_user(self, identity: str) -> User:
         return self[identity]
 
+    def __setitem__(self, uid: str, value: User):
+        super().__setitem__(uid, value)
+        self._current_user = None
+        self._non_system_users = None
+
+    def __delitem__(self, uid: str):
+        super().__delitem__(uid)
+        self._current_user = None
+        self._non_system_users = None
+
+    def _on_setting_changed(self, event: str, old_values: dict[str, str], new_values: dict[str, str]):
+        # Those are the settings get_username() depends on
+        if 'Source.type' in new_values or 'WebsocketEventSource.username' in new_values:
+            self._current_user = None
+
     def get_current_user(self) -> User:
-        return self[self._settings.get_username()]
+        # This is called a lot from the UI. The cache is reset when the user is replaced or removed,
+        # or when the username might have changed in Settings.
+        if self._current_user is None:
+            self._current_user = self[self._settings.get_username()]
+        return self._current_user
+
+    def non_system_users(self) -> tuple[User, ...]:
+        # Users only change via __setitem__ / __delitem__, which reset this
+        if self._non_system_users is None:
+            self._non_system_users = tuple(u for u in self.values() if not u.is_system_user())
+        return self._non_system_users
@@ -44,7 +44,7 @@ from fk.qt.render.classic_timer_renderer import ClassicTimerRenderer
 from fk.qt.render.minimal_timer_renderer import MinimalTimerRenderer
 from fk.qt.resize_event_filter import ResizeEventFilter
 from fk.qt.search_completer import SearchBar
-from fk.qt.theme_change_event_filter import ThemeChangeEventFilter
+from fk.qt.theme_change_listener import ThemeChangeListener
 from fk.qt.tray_icon import TrayIcon
 from fk.qt.user_tableview import UserTableView
 from fk.qt.workitem_tableview import WorkitemTableView
@@ -62,7 +62,7 @@ def pin_if_needed():
     window_was_visible = window.isVisible()
     focus_window_was_visible = focus_window.isVisible()
 
-    is_pinned = settings.get('Application.always_on_top') == 'True'
+    is_pinned = settings.get_bool('Application.always_on_top')
     window.setWindowFlags(window.windowFlags() | Qt.WindowType.WindowStaysOnTopHint if is_pinned else
                           window.windowFlags() & ~Qt.WindowType.WindowStaysOnTopHint)
     focus_window.setWindowFlags(focus_window.windowFlags() | Qt.WindowType.WindowStaysOnTopHint if is_pinned else
@@ -82,7 +82,7 @@ def to_focus_mode(**kwargs) -> None:
     focus_window.setFixedWidth(focus_widget.width())
     focus_window.setFixedHeight(focus_widget.height())
 
-    show_title = settings.get('Application.show_window_title') == 'True'
+    show_title = settings.get_bool('Application.show_window_title')
     focus_window.setWindowFlags(focus_window.windowFlags() & ~Qt.WindowType.FramelessWindowHint if show_title else
                                 focus_window.windowFlags() | Qt.WindowType.FramelessWindowHint)
     focus_window.show()
@@ -96,9 +96,9 @@ def from_focus_mode(**kwargs) -> None:
 
 
 def update_tables_visibility() -> None:
-    users_visible = (settings.get('Application.users_visible') == 'True')
+    users_visible = settings.get_bool('Application.users_visible')
     users_table.setVisible(users_visible)
-    backlogs_visible = (settings.get('Application.backlogs_visible') == 'True')
+    backlogs_visible = settings.get_bool('Application.backlogs_visible')
     backlogs_widget.setVisible(backlogs_visible)
     left_table_layout.setVisible(users_visible or backlogs_visible)
 
@@ -146,6 +146,10 @@ def recreate_tray_icon() -> None:
     if tray is not None:
         tray.kill()
         tray.setVisible(False)
+        tray = None
+    if not settings.get_bool('Application.show_tray_icon'):
+        # We'll create it once the user enables it in Settings
+        return
     flavor = settings.get('Application.tray_icon_flavor')
     tray = TrayIcon(window,
                     pomodoro_timer,
@@ -154,7 +158,7 @@ def recreate_tray_icon() -> None:
                     48,
                     MinimalTimerRenderer if 'thin' in flavor else ClassicTimerRenderer,
                     'dark' in flavor)
-    tray.setVisible(settings.get('Application.show_tray_icon') == 'True')
+    tray.setVisible(True)
 
 
 def on_setting_changed(event: str, old_values: dict[str, str], new_values: dict[str, str]):
@@ -169,7 +173,10 @@ def on_setting_changed(event: str, old_values: dict[str, str], new_values: dict[
         elif name == 'Application.show_left_toolbar':
             left_toolbar.setVisible(new_value == 'True')
         elif name == 'Application.show_tray_icon':
-            tray.setVisible(new_value == 'True')
+            if tray is None:
+                recreate_tray_icon()
+            else:
+                tray.setVisible(new_value == 'True')
         elif name == 'Application.shortcuts':
             actions.update_from_settings()
         elif name == 'Application.always_on_top':
@@ -241,7 +248,7 @@ class MainWindow:
         actions.add('window.showSearch', "Search...", 'Ctrl+F', '', MainWindow.show_search)
         actions.add('window.quickConfig', "Quick Config", '', None, MainWindow.show_quick_config)
 
-        backlogs_were_visible = (actions.get_settings().get('Application.backlogs_visible') == 'True')
+        backlogs_were_visible = actions.get_settings().get_bool('Application.backlogs_visible')
         actions.add('window.showBacklogs',
                     "Show / Hide Backlogs",
                     'Ctrl+B',
@@ -250,7 +257,7 @@ class MainWindow:
                     True,
                     backlogs_were_visible)
 
-        users_were_visible = (actions.get_settings().get('Application.users_visible') == 'True')
+        users_were_visible = actions.get_settings().get_bool('Application.users_visible')
         actions.add('window.showUsers',
                     "Team",
                     'Ctrl+T',
@@ -299,6 +306,12 @@ if __name__ == "__main__":
         window: QtWidgets.QMainWindow = loader.load(file, None)
         file.close()
 
+        # Collect all named widgets and layouts from core.ui in a single pass over the object tree,
+        # instead of doing a recursive findChild() lookup for each of them
+        ui_objects: dict[str, QtCore.QObject] = {
+            obj.objectName(): obj for obj in window.findChildren(QtCore.QObject) if obj.objectName()
+        }
+
         # Collect actions from all widget types
         actions = Actions(window, settings)
         Application.define_actions(actions)
@@ -325,10 +338,10 @@ if __name__ == "__main__":
         menu_file.addAction(actions['application.quit'])
 
         # noinspection PyTypeChecker
-        left_layout: QtWidgets.QVBoxLayout = window.findChild(QtWidgets.QVBoxLayout, "leftTableLayoutInternal")
+        left_layout: QtWidgets.QVBoxLayout = ui_objects.get("leftTableLayoutInternal")
 
         # noinspection PyTypeChecker
-        left_toolbar_layout: QtWidgets.QVBoxLayout = window.findChild(QtWidgets.QVBoxLayout, "left_toolbar_layout")
+        left_toolbar_layout: QtWidgets.QVBoxLayout = ui_objects.get("left_toolbar_layout")
         left_toolbar_layout.addWidget(ConnectionWidget(window, app))
 
         # Backlogs table
@@ -344,7 +357,7 @@ if __name__ == "__main__":
         left_layout.addWidget(users_table)
 
         # noinspection PyTypeChecker
-        right_layout: QtWidgets.QVBoxLayout = window.findChild(QtWidgets.QVBoxLayout, "rightTableLayoutInternal")
+        right_layout: QtWidgets.QVBoxLayout = ui_objects.get("rightTableLayoutInternal")
 
         # Workitems table
         workitems_widget: WorkitemWidget = WorkitemWidget(window, app, app.get_source_holder(), actions)
@@ -354,7 +367,7 @@ if __name__ == "__main__":
         right_layout.addWidget(progress_widget)
 
         # noinspection PyTypeChecker
-        search_bar: QtWidgets.QHBoxLayout = window.findChild(QtWidgets.QHBoxLayout, "searchBar")
+        search_bar: QtWidgets.QHBoxLayout = ui_objects.get("searchBar")
         search = SearchBar(window,
                            app.get_source_holder(),
                            actions,
@@ -363,10 +376,10 @@ if __name__ == "__main__":
         search_bar.addWidget(search)
 
         # noinspection PyTypeChecker
-        root_layout_widget: QtWidgets.QWidget = window.findChild(QtWidgets.QWidget, "rootLayout")
+        root_layout_widget: QtWidgets.QWidget = ui_objects.get("rootLayout")
 
         # noinspection PyTypeChecker
-        root_layout: QtWidgets.QVBoxLayout = window.findChild(QtWidgets.QVBoxLayout, "rootLayoutInternal")
+        root_layout: QtWidgets.QVBoxLayout = ui_objects.get("rootLayoutInternal")
         focus_widget = None
         recreate_focus_widget()
 
@@ -379,9 +392,9 @@ if __name__ == "__main__":
 
         # Layouts
         # noinspection PyTypeChecker
-        main_layout: QtWidgets.QWidget = window.findChild(QtWidgets.QWidget, "mainLayout")
+        main_layout: QtWidgets.QWidget = ui_objects.get("mainLayout")
         # noinspection PyTypeChecker
-        left_table_layout: QtWidgets.QWidget = window.findChild(QtWidgets.QWidget, "leftTableLayout")
+        left_table_layout: QtWidgets.QWidget = ui_objects.get("leftTableLayout")
 
         # noinspection PyTypeChecker
         action_backlogs = actions['window.showBacklogs']
@@ -389,7 +402,7 @@ if __name__ == "__main__":
 
         # Main menu
         # noinspection PyTypeChecker
-        main_menu: QtWidgets.QMenuBar = window.findChild(QtWidgets.QMenuBar, "menuBar")
+        main_menu: QtWidgets.QMenuBar = ui_objects.get("menuBar")
         # Application.define_actions(actions)
         # BacklogTableView.define_actions(actions)
         # UserTableView.define_actions(actions)
@@ -424,14 +437,14 @@ if __name__ == "__main__":
             workitems_menu.addAction(actions['workitems_table.removePomodoro'])
             workitems_menu.addAction(actions['focus.voidPomodoro'])
             main_menu.addMenu(workitems_menu)
-            show_main_menu = (settings.get('Application.show_main_menu') == 'True')
+            show_main_menu = settings.get_bool('Application.show_main_menu')
             main_menu.setVisible(show_main_menu)
 
         # Status bar
         # noinspection PyTypeChecker
-        status: QtWidgets.QStatusBar = window.findChild(QtWidgets.QStatusBar, "statusBar")
+        status: QtWidgets.QStatusBar = ui_objects.get("statusBar")
         if status is not None:
-            show_status_bar = (settings.get('Application.show_status_bar') == 'True')
+            show_status_bar = settings.get_bool('Application.show_status_bar')
             status.showMessage('Ready')
             status.setVisible(show_status_bar)
 
@@ -445,25 +458,26 @@ if __name__ == "__main__":
 
         # Left toolbar
         # noinspection PyTypeChecker
-        left_toolbar: QtWidgets.QWidget = window.findChild(QtWidgets.QWidget, "left_toolbar")
-        show_left_toolbar = (settings.get('Application.show_left_toolbar') == 'True')
+        left_toolbar: QtWidgets.QWidget = ui_objects.get("left_toolbar")
+        show_left_toolbar = settings.get_bool('Application.show_left_toolbar')
         left_toolbar.setVisible(show_left_toolbar)
 
         # noinspection PyTypeChecker
-        tool_backlogs: QtWidgets.QToolButton = window.findChild(QtWidgets.QToolButton, "toolBacklogs")
+        tool_backlogs: QtWidgets.QToolButton = ui_objects.get("toolBacklogs")
         tool_backlogs.setDefaultAction(action_backlogs)
 
         # noinspection PyTypeChecker
-        tool_teams: QtWidgets.QToolButton = window.findChild(QtWidgets.QToolButton, "toolTeams")
+        tool_teams: QtWidgets.QToolButton = ui_objects.get("toolTeams")
         tool_teams.setDefaultAction(action_teams)
-        action_teams.setEnabled(settings.is_team_supported())
-        tool_teams.setVisible(settings.is_team_supported())
+        team_supported = settings.is_team_supported()
+        action_teams.setEnabled(team_supported)
+        tool_teams.setVisible(team_supported)
 
         # noinspection PyTypeChecker
-        tool_settings: QtWidgets.QToolButton = window.findChild(QtWidgets.QToolButton, "toolSettings")
+        tool_settings: QtWidgets.QToolButton = ui_objects.get("toolSettings")
         tool_settings.setIcon(QIcon.fromTheme('tool-settings'))
         tool_settings.clicked.connect(lambda: menu_file.exec(
-            tool_settings.parentWidget().mapToGlobal(tool_settings.geometry().center())
+            tool_settings.mapToGlobal(tool_settings.rect().center())
         ))
 
         # Restore window config from settings
@@ -473,8 +487,8 @@ if __name__ == "__main__":
         window.installEventFilter(resize_event_filter)
         window.move(app.primaryScreen().geometry().center() - window.frameGeometry().center())
 
-        theme_change_event_filter = ThemeChangeEventFilter(window, settings)
-        window.installEventFilter(theme_change_event_filter)
+        # Signal-driven, and parented to the window, which keeps it alive
+        ThemeChangeListener(window, settings)
 
         main_window = MainWindow()
         app.upgraded.connect(main_window.show_quick_config)
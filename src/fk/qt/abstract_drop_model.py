@@ -23,15 +23,16 @@ from PySide6.QtGui import QStandardItem, QStandardItemModel
 
 from fk.core.abstract_data_item import AbstractDataItem
 from fk.core.event_source_holder import EventSourceHolder
+from fk.qt.item_roles import ROLE_OBJECT, ROLE_TYPE
 
 
 class DropPlaceholderItem(QStandardItem):
     def __init__(self, based_on_index: QModelIndex):
         super().__init__()
-        self.setData(None, 500)
+        self.setData(None, ROLE_OBJECT)
         self.setData(based_on_index.data(Qt.ItemDataRole.FontRole), Qt.ItemDataRole.FontRole)
         self.setData(based_on_index.data(Qt.ItemDataRole.SizeHintRole), Qt.ItemDataRole.SizeHintRole)
-        self.setData('drop', 501)
+        self.setData('drop', ROLE_TYPE)
         self.setData('', Qt.ItemDataRole.DisplayRole)
         flags = (Qt.ItemFlag.ItemIsSelectable |
                  Qt.ItemFlag.ItemIsEnabled |
@@ -41,6 +42,7 @@ class DropPlaceholderItem(QStandardItem):
 
 class AbstractDropModel(QStandardItemModel):
     _source_holder: EventSourceHolder
+    _row_by_uid: dict[str, int] | None
 
     def __init__(self,
                  columns: int,
@@ -48,12 +50,31 @@ class AbstractDropModel(QStandardItemModel):
                  source_holder: EventSourceHolder):
         super().__init__(0, columns, parent)
         self._source_holder = source_holder
+        self._row_by_uid = None
+        # Any structural change invalidates the uid -> row index. It gets rebuilt lazily on the next lookup.
+        self.rowsInserted.connect(self._invalidate_row_index)
+        self.rowsRemoved.connect(self._invalidate_row_index)
+        self.rowsMoved.connect(self._invalidate_row_index)
+        self.layoutChanged.connect(self._invalidate_row_index)
+        self.modelReset.connect(self._invalidate_row_index)
+
+    def _invalidate_row_index(self, *args) -> None:
+        self._row_by_uid = None
+
+    def find_row(self, data: AbstractDataItem) -> int:
+        if self._row_by_uid is None:
+            self._row_by_uid = dict()
+            for i in range(self.rowCount()):
+                item: AbstractDataItem = self.item(i).data(ROLE_OBJECT)
+                if item is not None:    # Skip drop placeholders
+                    self._row_by_uid[item.get_uid()] = i
+        return self._row_by_uid.get(data.get_uid(), -1)
 
     def supportedDropActions(self) -> Qt.DropAction:
         return Qt.DropAction.MoveAction
 
     def dropMimeData(self, data: QMimeData, action: Qt.DropAction, row: int, column: int, where: QModelIndex):
-        if where.data(501) == 'drop':
+        if where.data(ROLE_TYPE) == 'drop':
             item_id = data.data(self.get_type()).toStdString()
             self.reorder(where.row(), item_id)
             self.remove_drop_placeholder()
@@ -82,14 +103,14 @@ class AbstractDropModel(QStandardItemModel):
         if len(indexes) != 1:
             raise Exception(f'Unexpected number of rows to move: {len(indexes)}')
         data = QMimeData()
-        item: AbstractDataItem = indexes[0].data(500)
+        item: AbstractDataItem = indexes[0].data(ROLE_OBJECT)
         data.setData(self.get_type(), bytes(item.get_uid(), 'iso8859-1'))
         return data
 
     def remove_drop_placeholder(self):
         # We can only have one placeholder
         for i in range(self.rowCount()):
-            if self.index(i, 0).data(501) == 'drop':
+            if self.index(i, 0).data(ROLE_TYPE) == 'drop':
                 self.removeRow(i)
                 return  # We won't have more than one
 
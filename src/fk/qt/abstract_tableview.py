@@ -17,8 +17,8 @@ import logging
 from abc import abstractmethod
 from typing import TypeVar, Generic
 
-from PySide6.QtCore import Qt, QModelIndex, QItemSelectionModel
-from PySide6.QtGui import QPainter, QStandardItemModel
+from PySide6.QtCore import Qt, QModelIndex, QItemSelectionModel, QAbstractItemModel
+from PySide6.QtGui import QPainter
 from PySide6.QtWidgets import QTableView, QWidget, QAbstractItemView
 
 from fk.core.abstract_data_item import AbstractDataItem
@@ -26,7 +26,9 @@ from fk.core.abstract_event_emitter import AbstractEventEmitter
 from fk.core.abstract_event_source import AbstractEventSource
 from fk.core.event_source_holder import EventSourceHolder, BeforeSourceChanged
 from fk.core.events import SourceMessagesProcessed, AfterSettingsChanged
+from fk.qt.abstract_drop_model import AbstractDropModel
 from fk.qt.actions import Actions
+from fk.qt.item_roles import ROLE_OBJECT, ROLE_TYPE
 
 logger = logging.getLogger(__name__)
 
@@ -45,13 +47,15 @@ class AbstractTableView(QTableView, AbstractEventEmitter, Generic[TUpstream, TDo
     _placeholder_loading: str
     _placeholder_upstream: str
     _placeholder_empty: str
+    _placeholder: str | None
     _editable_column: int
     _row_height: int
+    _last_selected: TDownstream | None
 
     def __init__(self,
                  parent: QWidget,
                  source_holder: EventSourceHolder,
-                 model: QStandardItemModel,
+                 model: QAbstractItemModel,
                  name: str,
                  actions: Actions,
                  placeholder_loading: str,
@@ -72,7 +76,14 @@ class AbstractTableView(QTableView, AbstractEventEmitter, Generic[TUpstream, TDo
         self._placeholder_upstream = placeholder_upstream
         self._placeholder_empty = placeholder_empty
         self._editable_column = editable_column
+        self._placeholder = placeholder_loading
+        self._last_selected = None
         self.setModel(model)
+        model.rowsInserted.connect(self._update_placeholder)
+        model.rowsRemoved.connect(self._update_placeholder)
+        model.modelReset.connect(self._update_placeholder)
+        # Selection model drops the current index on reset without telling anyone
+        model.modelReset.connect(self._forget_last_selected)
 
         self.setObjectName(name)
         self.setTabKeyNavigation(False)
@@ -110,11 +121,13 @@ class AbstractTableView(QTableView, AbstractEventEmitter, Generic[TUpstream, TDo
         self._source = source
         self._is_data_loaded = False
         self._is_upstream_item_selected = False
+        self._update_placeholder()
         source.on(SourceMessagesProcessed, self._on_data_loaded)
 
     def _on_data_loaded(self, event: str, source: AbstractEventSource) -> None:
         logger.debug(f'Data loaded - {self.objectName()}')
         self._is_data_loaded = True
+        self._update_placeholder()
         self.repaint()
 
     @staticmethod
@@ -128,11 +141,12 @@ class AbstractTableView(QTableView, AbstractEventEmitter, Generic[TUpstream, TDo
         else:
             self._is_upstream_item_selected = True
         self.model().load(upstream)  # Should handle None correctly
+        self._update_placeholder()
 
     def get_current(self) -> TDownstream | None:
         index = self.currentIndex()
         if index is not None:
-            return index.data(500)
+            return index.data(ROLE_OBJECT)
 
     @abstractmethod
     def update_actions(self, selected: TDownstream | None) -> None:
@@ -141,11 +155,16 @@ class AbstractTableView(QTableView, AbstractEventEmitter, Generic[TUpstream, TDo
     def _on_current_changed(self, selected: QModelIndex | None, deselected: QModelIndex | None) -> None:
         after: TDownstream | None = None
         if selected is not None:
-            after = selected.data(500)
+            after = selected.data(ROLE_OBJECT)
+
+        if after is self._last_selected:
+            # E.g. the same item got moved to a different row, nothing to update
+            return
+        self._last_selected = after
 
         before: TDownstream | None = None
         if deselected is not None:
-            before = deselected.data(500)
+            before = deselected.data(ROLE_OBJECT)
 
         params = {
             'before': before,
@@ -155,46 +174,60 @@ class AbstractTableView(QTableView, AbstractEventEmitter, Generic[TUpstream, TDo
         self.update_actions(after)
         self._emit(AfterSelectionChanged, params)
 
-    def paintEvent(self, e):
-        super().paintEvent(e)
-
+    def _update_placeholder(self, *args) -> None:
         # We may have four situations:
         # 1. The data source hasn't loaded yet
         # 2. The user hasn't selected an upstream yet
         # 3. There are no items in the upstream
         # 4. There are items to display
-        text: str
+        # We recompute it only when one of those changes, and not on every repaint.
         if not self._is_data_loaded:
-            text = self._placeholder_loading
+            self._placeholder = self._placeholder_loading
         elif not self._is_upstream_item_selected:
-            text = self._placeholder_upstream
+            self._placeholder = self._placeholder_upstream
         elif self.model().rowCount() == 0:
-            text = self._placeholder_empty
+            self._placeholder = self._placeholder_empty
         else:
+            self._placeholder = None
+
+    def _forget_last_selected(self) -> None:
+        self._last_selected = None
+
+    def paintEvent(self, e):
+        super().paintEvent(e)
+        if self._placeholder is None:
             return
 
         painter = QPainter(self.viewport())
-        painter.save()
         painter.setPen(self.palette().placeholderText().color())
         painter.drawText(self.viewport().rect(),
                          Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap,
-                         text)
-        painter.restore()
+                         self._placeholder)
         painter.end()
 
-    def select(self, data: TDownstream) -> QModelIndex:
+    def _find_index(self, data: TDownstream) -> QModelIndex | None:
         model = self.model()
+        if isinstance(model, AbstractDropModel):
+            row = model.find_row(data)
+            if row >= 0:
+                return model.index(row, self._editable_column)
+        # Models without a uid -> row index
         for i in range(model.rowCount()):
             index = model.index(i, self._editable_column)
-            if model.data(index, 500) == data:
-                self.selectionModel().select(index,
-                                             QItemSelectionModel.SelectionFlag.SelectCurrent |
-                                             QItemSelectionModel.SelectionFlag.ClearAndSelect |
-                                             QItemSelectionModel.SelectionFlag.Rows)
-                self.setCurrentIndex(index)
-                self.scrollTo(index)
+            if model.data(index, ROLE_OBJECT) == data:
                 return index
-        raise Exception(f"Trying to select a table item {data}, which does not exist")
+
+    def select(self, data: TDownstream) -> QModelIndex:
+        index = self._find_index(data)
+        if index is None:
+            raise Exception(f"Trying to select a table item {data}, which does not exist")
+        self.selectionModel().select(index,
+                                     QItemSelectionModel.SelectionFlag.SelectCurrent |
+                                     QItemSelectionModel.SelectionFlag.ClearAndSelect |
+                                     QItemSelectionModel.SelectionFlag.Rows)
+        self.setCurrentIndex(index)
+        self.scrollTo(index)
+        return index
 
     def deselect(self) -> None:
         self.selectionModel().clearSelection()
@@ -204,13 +237,14 @@ class AbstractTableView(QTableView, AbstractEventEmitter, Generic[TUpstream, TDo
         self.selectionModel().blockSignals(True)
         self.setCurrentIndex(QModelIndex())
         self.selectionModel().blockSignals(False)
+        self._last_selected = None
 
         self.update_actions(None)
 
     def dragMoveEvent(self, event):
         super().dragMoveEvent(event)
         index: QModelIndex = self.indexAt(event.pos())
-        if index.data(501) == 'title':
+        if index.data(ROLE_TYPE) == 'title':
             # Hovering over a "real" item. Insert a "drop placeholder" here instead.
             self.model().create_drop_placeholder(index)
         else:
@@ -29,6 +29,7 @@ from fk.core.backlog_strategies import RenameBacklogStrategy, ReorderBacklogStra
 from fk.core.event_source_holder import EventSourceHolder, AfterSourceChanged
 from fk.core.user import User
 from fk.qt.abstract_drop_model import AbstractDropModel
+from fk.qt.item_roles import ROLE_OBJECT, ROLE_TYPE
 from fk.qt.qt_timer import QtTimer
 
 logger = logging.getLogger(__name__)
@@ -43,9 +44,9 @@ class BacklogItem(QtGui.QStandardItem):
     def __init__(self, backlog: Backlog):
         super().__init__()
         self._backlog = backlog
-        self.setData(backlog, 500)
+        self.setData(backlog, ROLE_OBJECT)
         self.setData(backlog.get_name(), Qt.ItemDataRole.ToolTipRole)
-        self.setData('title', 501)
+        self.setData('title', ROLE_TYPE)
         default_flags = (Qt.ItemFlag.ItemIsSelectable |
                          Qt.ItemFlag.ItemIsEnabled |
                          Qt.ItemFlag.ItemIsDragEnabled |
@@ -85,8 +86,8 @@ class BacklogModel(AbstractDropModel):
         source.on(events.AfterBacklogReorder, self._backlog_reordered)
 
     def _handle_rename(self, item: QtGui.QStandardItem) -> None:
-        if item.data(501) == 'title':
-            backlog = item.data(500)
+        if item.data(ROLE_TYPE) == 'title':
+            backlog = item.data(ROLE_OBJECT)
             old_name = backlog.get_name()
             new_name = item.text()
             if old_name != new_name:
@@ -107,14 +108,14 @@ class BacklogModel(AbstractDropModel):
 
     def _backlog_removed(self, backlog: Backlog, **kwargs) -> None:
         for i in range(self.rowCount()):
-            bl = self.item(i).data(500)
+            bl = self.item(i).data(ROLE_OBJECT)
             if bl == backlog:
                 self.removeRow(i)
                 return
 
     def _backlog_renamed(self, backlog: Backlog, **kwargs) -> None:
         for i in range(self.rowCount()):
-            bl = self.item(i).data(500)
+            bl = self.item(i).data(ROLE_OBJECT)
             if bl == backlog:
                 self.item(i).update_display()
                 return
@@ -137,7 +138,7 @@ class BacklogModel(AbstractDropModel):
     def _backlog_reordered(self, backlog: Backlog, new_index: int, carry: str, **kwargs) -> None:
         if carry != 'ui':
             for old_index in range(self.rowCount()):
-                bl = self.item(old_index).data(500)
+                bl = self.item(old_index).data(ROLE_OBJECT)
                 if bl == backlog:
                     new_index = self.rowCount() - new_index
                     if new_index > old_index:
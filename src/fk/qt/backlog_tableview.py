@@ -16,10 +16,10 @@
 import datetime
 import logging
 
-from PySide6.QtCore import Qt, QModelIndex
+from PySide6.QtCore import Qt, QModelIndex, QPoint
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QWidget, QHeaderView, QMenu, QMessageBox, QInputDialog
 
-from fk.core import events
 from fk.core.abstract_data_item import generate_unique_name, generate_uid
 from fk.core.abstract_event_source import AbstractEventSource
 from fk.core.backlog import Backlog
@@ -34,13 +34,21 @@ from fk.desktop.application import Application
 from fk.qt.abstract_tableview import AbstractTableView, AfterSelectionChanged
 from fk.qt.actions import Actions
 from fk.qt.backlog_model import BacklogModel
+from fk.qt.qt_timer import QtTimer
 
 logger = logging.getLogger(__name__)
 
 
 class BacklogTableView(AbstractTableView[User, Backlog]):
     _application: Application
-    _menu: QMenu
+    _menu: QMenu | None
+    _save_selection_timer: QtTimer
+    _pending_last_selected: str | None
+    _action_new: QAction
+    _action_new_from_incomplete: QAction
+    _action_rename: QAction
+    _action_delete: QAction
+    _action_dump: QAction
 
     def __init__(self,
                  parent: QWidget,
@@ -56,21 +64,48 @@ class BacklogTableView(AbstractTableView[User, Backlog]):
                          'No data or connection error.',
                          "You haven't got any backlogs yet. Create the first one by pressing Ctrl+N.",
                          0)
-        self._menu = self._init_menu(actions)
+        # update_actions() is called on every selection change and heartbeat, so we look those up once
+        self._action_new = actions['backlogs_table.newBacklog']
+        self._action_new_from_incomplete = actions['backlogs_table.newBacklogFromIncomplete']
+        self._action_rename = actions['backlogs_table.renameBacklog']
+        self._action_delete = actions['backlogs_table.deleteBacklog']
+        self._action_dump = actions['backlogs_table.dumpBacklog']
+        self._menu = None   # Created on the first right-click
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(self._show_menu)
         source_holder.on(AfterSourceChanged, self._on_source_changed)
-        self.on(AfterSelectionChanged, lambda event, before, after: self._application.get_settings().set({
-            'Application.last_selected_backlog': after.get_uid() if after is not None else ''
-        }))
+        # Arrow-key navigation changes selection on every keystroke, so we persist it only once it settles.
+        # Whatever is still pending gets flushed on source change and on quit, so that we don't lose it.
+        self._pending_last_selected = None
+        self._save_selection_timer = QtTimer('Save last selected backlog')
+        self.on(AfterSelectionChanged, self._on_selection_changed)
         self._application = application
+        application.aboutToQuit.connect(self._flush_last_selected)
         self.update_actions(None)
 
-    def _lock_ui(self, event, after: int, last_received: datetime.datetime) -> None:
-        self.update_actions(self.get_current())
+    def _on_selection_changed(self, event: str, before: Backlog | None, after: Backlog | None) -> None:
+        self._pending_last_selected = after.get_uid() if after is not None else ''
+        self._save_selection_timer.schedule(500, self._save_last_selected, None, True)
+
+    def _save_last_selected(self, params: dict | None, when: datetime.datetime) -> None:
+        self._flush_last_selected()
+
+    def _flush_last_selected(self) -> None:
+        self._save_selection_timer.cancel()
+        if self._pending_last_selected is not None:
+            uid = self._pending_last_selected
+            self._pending_last_selected = None
+            self._application.get_settings().set({
+                'Application.last_selected_backlog': uid
+            })
 
-    def _unlock_ui(self, event, ping: int) -> None:
+    def _on_heartbeat(self, event: str, **kwargs) -> None:
+        # Going online or offline changes which actions are allowed
         self.update_actions(self.get_current())
 
     def _on_source_changed(self, event: str, source: AbstractEventSource) -> None:
+        # Persist the selection made in the previous source before it gets cleared below
+        self._flush_last_selected()
         super()._on_source_changed(event, source)
         self.selectionModel().clear()
         self.upstream_selected(None)
@@ -85,26 +120,28 @@ class BacklogTableView(AbstractTableView[User, Backlog]):
                   lambda workitem, **kwargs: self._update_actions_if_needed(workitem))
 
         heartbeat = self._application.get_heartbeat()
-        heartbeat.on(events.WentOffline, self._lock_ui)
-        heartbeat.on(events.WentOnline, self._unlock_ui)
+        heartbeat.on('Went*', self._on_heartbeat)    # WentOnline and WentOffline
 
-    def _init_menu(self, actions: Actions) -> QMenu:
+    def _init_menu(self) -> QMenu:
         menu: QMenu = QMenu()
         menu.addActions([
-            actions['backlogs_table.newBacklog'],
-            actions['backlogs_table.newBacklogFromIncomplete'],
-            actions['backlogs_table.renameBacklog'],
-            actions['backlogs_table.deleteBacklog'],
+            self._action_new,
+            self._action_new_from_incomplete,
+            self._action_rename,
+            self._action_delete,
             # Uncomment to troubleshoot
-            # actions['backlogs_table.dumpBacklog'],
+            # self._action_dump,
         ])
-        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.customContextMenuRequested.connect(lambda p: menu.exec(self.mapToGlobal(p)))
         return menu
 
+    def _show_menu(self, pos: QPoint) -> None:
+        if self._menu is None:
+            self._menu = self._init_menu()
+        self._menu.exec(self.mapToGlobal(pos))
+
     def upstream_selected(self, user: User) -> None:
         super().upstream_selected(user)
-        self._actions['backlogs_table.newBacklog'].setEnabled(user is not None)
+        self._action_new.setEnabled(user is not None)
         self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
 
     def _update_actions_if_needed(self, workitem: Workitem):
@@ -115,7 +152,9 @@ class BacklogTableView(AbstractTableView[User, Backlog]):
                 self.update_actions(current)
 
     def update_actions(self, selected: Backlog) -> None:
-        logger.debug(f'Backlog table - update_actions({selected})')
+        is_debug = logger.isEnabledFor(logging.DEBUG)  # This is called very often
+        if is_debug:
+            logger.debug(f'Backlog table - update_actions({selected})')
         # It can be None for example if we don't have any backlogs left, or if
         # we haven't loaded any yet. BacklogModel supports None.
         is_backlog_selected = selected is not None
@@ -125,18 +164,17 @@ class BacklogTableView(AbstractTableView[User, Backlog]):
         heartbeat = self._application.get_heartbeat()
         source = self._application.get_source_holder().get_source()
         is_online = heartbeat.is_online() or source is None or not source.can_connect()
-        logger.debug(f' - Online: {is_online}')
-        logger.debug(f' - Backlog selected: {is_backlog_selected}')
-        logger.debug(f' - Has incomplete workitems: {is_incomplete}')
-        logger.debug(f' - Heartbeat: {heartbeat}')
-
-        self._actions['backlogs_table.newBacklog'].setEnabled(is_online)
-        self._actions['backlogs_table.newBacklogFromIncomplete'].setEnabled(is_backlog_selected and
-                                                                            is_online and
-                                                                            is_incomplete)
-        self._actions['backlogs_table.renameBacklog'].setEnabled(is_backlog_selected and is_online)
-        self._actions['backlogs_table.deleteBacklog'].setEnabled(is_backlog_selected and is_online)
-        self._actions['backlogs_table.dumpBacklog'].setEnabled(is_backlog_selected)
+        if is_debug:
+            logger.debug(f' - Online: {is_online}')
+            logger.debug(f' - Backlog selected: {is_backlog_selected}')
+            logger.debug(f' - Has incomplete workitems: {is_incomplete}')
+            logger.debug(f' - Heartbeat: {heartbeat}')
+
+        self._action_new.setEnabled(is_online)
+        self._action_new_from_incomplete.setEnabled(is_backlog_selected and is_online and is_incomplete)
+        self._action_rename.setEnabled(is_backlog_selected and is_online)
+        self._action_delete.setEnabled(is_backlog_selected and is_online)
+        self._action_dump.setEnabled(is_backlog_selected)
         # TODO: Double-clicking the backlog name doesn't use those
 
     def _on_new_backlog(self, backlog: Backlog, carry: any = None, **kwargs):
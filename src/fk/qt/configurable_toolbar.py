@@ -24,14 +24,18 @@ from fk.qt.info_overlay import show_info_overlay
 
 class ConfigurableToolBar(QToolBar):
     _actions: Actions
+    _context_menu: QMenu | None
+    _context_menu_pos: QPoint | None
 
     def __init__(self, parent: QWidget, actions: Actions, name: str):
         super().__init__(parent)
         self._actions = actions
+        self._context_menu = None
+        self._context_menu_pos = None
         self.setStyle(QStyleFactory.create("windows"))
         settings = actions.get_settings()
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
-        self.setVisible(settings.get('Application.show_toolbar') == 'True')
+        self.setVisible(settings.get_bool('Application.show_toolbar'))
         self.setObjectName(name)
         settings.on(AfterSettingsChanged, self._on_setting_changed)
 
@@ -39,23 +43,25 @@ class ConfigurableToolBar(QToolBar):
         if 'Application.show_toolbar' in new_values:
             self.setVisible(new_values['Application.show_toolbar'] == 'True')
 
-    def _hide(self, pos: QPoint):
+    def _hide(self):
         self._actions.get_settings().set({
             'Application.show_toolbar': 'False'
         })
         show_info_overlay("You can re-enable toolbar in Settings > Appearance",
-                          self.mapToGlobal(pos),
+                          self.mapToGlobal(self._context_menu_pos),
                           ":/icons/info.png",
                           5)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.type() == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.RightButton:
-            act = QAction(self)
-            act.setText("Hide toolbar")
-            act.triggered.connect(lambda: self._hide(event.pos()))
-            context_menu = QMenu()
-            context_menu.addAction(act)
-            context_menu.exec(
+            if self._context_menu is None:
+                act = QAction(self)
+                act.setText("Hide toolbar")
+                act.triggered.connect(self._hide)
+                self._context_menu = QMenu()
+                self._context_menu.addAction(act)
+            self._context_menu_pos = event.pos()
+            self._context_menu.exec(
                 self.parentWidget().mapToGlobal(
                     event.pos()))
 
@@ -0,0 +1,20 @@
+#  Flowkeeper - Pomodoro timer for power users and teams
+#  Copyright (c) 2023 Constantine Kulak
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# Custom item data roles, shared by all our Qt models, delegates and views.
+# Note that those are NOT Qt.UserRole (256) + N. Their values are kept as
+# they were when we used the numbers directly.
+ROLE_OBJECT = 500   # The underlying data item, e.g. a Backlog or a Workitem. None for drop placeholders.
+ROLE_TYPE = 501     # Item type, e.g. 'title', 'planned', 'pomodoro' or 'drop'
@@ -17,6 +17,8 @@ from PySide6 import QtWidgets, QtCore, QtSvg, QtGui
 from PySide6.QtCore import QSize
 from PySide6.QtGui import Qt
 
+from fk.qt.item_roles import ROLE_TYPE
+
 
 class PomodoroDelegate(QtWidgets.QItemDelegate):
     _svg_renderer: dict[str, QtSvg.QSvgRenderer]
@@ -40,7 +42,7 @@ class PomodoroDelegate(QtWidgets.QItemDelegate):
         }
 
     def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
-        if index.data(501) == 'pomodoro':  # We can also get a drop placeholder here, which we don't want to paint
+        if index.data(ROLE_TYPE) == 'pomodoro':  # We can also get a drop placeholder here, which we don't want to paint
             s: QSize = index.data(Qt.ItemDataRole.SizeHintRole)
             size = s.height()
             for i, p in enumerate(index.data().split(',')):
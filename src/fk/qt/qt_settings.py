@@ -38,10 +38,12 @@ class QtSettings(AbstractSettings):
     _settings: QtCore.QSettings
     _app_name: str
     _keyring_enabled: bool
+    _cache: dict[str, str]
 
     def __init__(self, app_name: str = 'flowkeeper-desktop'):
         font = QFont()
         self._app_name = app_name
+        self._cache = dict()
         super().__init__(font.family(),
                          font.pointSize(),
                          invoke_in_main_thread,
@@ -123,6 +125,8 @@ class QtSettings(AbstractSettings):
                     encrypted[name] = values[name]
                 else:
                     self._settings.setValue(name, values[name])
+                    # Invalidate it before AfterSettingsChanged, so that the listeners get the new value
+                    self._cache.pop(name, None)
             if len(encrypted) > 0:
                 if self._keyring_enabled:
                     existing = self.load_secret()
@@ -150,19 +154,28 @@ class QtSettings(AbstractSettings):
             else:
                 return self._defaults[name]
         else:
-            return str(self._settings.value(name, self._defaults[name]))
+            # Some settings are read very often, e.g. on every selection change, so we memoize them
+            # here. The cache is invalidated in set() and clear(), which are the only ways to modify them.
+            if name not in self._cache:
+                self._cache[name] = str(self._settings.value(name, self._defaults[name]))
+            return self._cache[name]
 
     def location(self) -> str:
         return self._settings.fileName()
 
     def clear(self) -> None:
         self._settings.clear()
+        self._cache.clear()
         try:
             keyring.delete_password(self._app_name, SECRET_NAME)
         except Exception as e:
             # Ignore, this is a common issue with keyring module.
             pass
 
+    def update_default(self, name: str, value: str) -> None:
+        super().update_default(name, value)
+        self._cache.pop(name, None)
+
     def is_keyring_enabled(self) -> bool:
         return self._keyring_enabled
 
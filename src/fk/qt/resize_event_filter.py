@@ -15,7 +15,7 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from PySide6.QtCore import QObject, QEvent, QSize
 from PySide6.QtGui import QResizeEvent
-from PySide6.QtWidgets import QWidget, QMainWindow, QSplitter
+from PySide6.QtWidgets import QWidget, QMainWindow, QSplitter, QApplication
 
 from fk.core.abstract_settings import AbstractSettings
 from fk.qt.qt_timer import QtTimer
@@ -24,6 +24,8 @@ from fk.qt.qt_timer import QtTimer
 class ResizeEventFilter(QMainWindow):
     _window: QMainWindow
     _timer: QtTimer
+    _splitter_timer: QtTimer
+    _pending_splitter_width: int | None
     _is_resizing: bool
     _settings: AbstractSettings
     _main_layout: QWidget
@@ -39,11 +41,15 @@ class ResizeEventFilter(QMainWindow):
         self._main_layout = main_layout
         self._timer = QtTimer("Window resizing")
         self._is_resizing = False
+        self._splitter_timer = QtTimer("Splitter moving")
+        self._pending_splitter_width = None
 
         # Splitter
         # noinspection PyTypeChecker
         self._splitter = window.findChild(QSplitter, "splitter")
-        self._splitter.splitterMoved.connect(self.save_splitter_size)
+        self._splitter.splitterMoved.connect(self._splitter_moved)
+        # Don't lose the last splitter move if the user quits right after it
+        QApplication.instance().aboutToQuit.connect(self._flush_splitter_size)
 
         self.restore_size()
 
@@ -63,7 +69,10 @@ class ResizeEventFilter(QMainWindow):
             })
 
     def eventFilter(self, widget: QObject, event: QEvent) -> bool:
-        if event.type() == QEvent.Type.Resize and isinstance(event, QResizeEvent):
+        if event.type() == QEvent.Type.Hide and widget == self._window:
+            # E.g. switching to focus mode or minimizing to tray
+            self._flush_splitter_size()
+        elif event.type() == QEvent.Type.Resize and isinstance(event, QResizeEvent):
             if widget == self._window:
                 if self._is_resizing:   # Don't fire those events too frequently
                     return False
@@ -81,6 +90,22 @@ class ResizeEventFilter(QMainWindow):
         self._splitter.setSizes([splitter_width, w - splitter_width])
         self._window.resize(QSize(w, h))
 
+    def _splitter_moved(self, new_width: int, index: int) -> None:
+        # This fires on every mouse move while dragging the splitter. Re-scheduling the timer
+        # restarts it, so we only save the width once the user stops moving it.
+        self._pending_splitter_width = new_width
+        self._splitter_timer.schedule(500,
+                                      lambda _1, _2: self._flush_splitter_size(),
+                                      None,
+                                      True)
+
+    def _flush_splitter_size(self) -> None:
+        self._splitter_timer.cancel()
+        if self._pending_splitter_width is not None:
+            new_width = self._pending_splitter_width
+            self._pending_splitter_width = None
+            self.save_splitter_size(new_width, 0)
+
     def save_splitter_size(self, new_width: int, index: int) -> None:
         old_width = int(self._settings.get('Application.window_splitter_width'))
         if old_width != new_width:
@@ -14,12 +14,13 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from PySide6 import QtWidgets, QtGui, QtCore
-from PySide6.QtCore import QModelIndex
-from PySide6.QtGui import QStandardItemModel, QStandardItem
+from PySide6.QtCore import QModelIndex, QStringListModel
 
 from fk.core.abstract_event_source import AbstractEventSource
 from fk.core.backlog import Backlog
 from fk.core.event_source_holder import EventSourceHolder, AfterSourceChanged
+from fk.core.events import AfterWorkitemCreate, AfterWorkitemDelete, AfterWorkitemRename, AfterWorkitemComplete, \
+    SourceMessagesProcessed
 from fk.core.user import User
 from fk.core.workitem import Workitem
 from fk.qt.abstract_tableview import AbstractTableView
@@ -32,6 +33,9 @@ class SearchBar(QtWidgets.QLineEdit):
     _workitems_table: AbstractTableView[Backlog, Workitem]
     _hide_completed: bool
     _actions: Actions
+    _model: QStringListModel
+    _workitems: list[Workitem]
+    _row_by_uid: dict[str, int]
 
     def __init__(self,
                  parent: QtWidgets.QWidget,
@@ -45,19 +49,100 @@ class SearchBar(QtWidgets.QLineEdit):
         self._backlogs_table = backlogs_table
         self._workitems_table = workitems_table
         self._hide_completed = False
+        self._workitems = list()
+        self._row_by_uid = dict()
         self.hide()
         self.setPlaceholderText('Search')
         self.installEventFilter(self)
         self._actions = actions
+
+        # The completion model is built once the data is loaded, and then
+        # kept up-to-date incrementally, instead of rebuilding it on every show().
+        # It only holds the names, with self._workitems keeping the corresponding
+        # workitems row by row. We can't map them by name, as those aren't unique,
+        # so self._row_by_uid maps workitem uids to rows instead.
+        self._model = QStringListModel(self)
+        completer = QtWidgets.QCompleter(self)
+        completer.setObjectName('search_completer')
+        completer.activated[QModelIndex].connect(self._select)
+        completer.setFilterMode(QtGui.Qt.MatchFlag.MatchContains)
+        completer.setCaseSensitivity(QtGui.Qt.CaseSensitivity.CaseInsensitive)
+        completer.setModel(self._model)
+        self.setCompleter(completer)
+
         actions['workitems_table.hideCompleted'].toggled.connect(self.hide_completed)
         source_holder.on(AfterSourceChanged, self._on_source_changed)
 
     def _on_source_changed(self, event: str, source: AbstractEventSource) -> None:
         if self.isVisible():
             self.hide()
+        self._clear()
+        source.on(SourceMessagesProcessed, self._on_messages)
+        source.on(AfterWorkitemCreate, self._workitem_created)
+        source.on(AfterWorkitemDelete, self._workitem_deleted)
+        source.on(AfterWorkitemRename, self._workitem_renamed)
+        source.on(AfterWorkitemComplete, self._workitem_completed)
+
+    def _on_messages(self, event: str, source: AbstractEventSource) -> None:
+        self._load()
+
+    def _clear(self) -> None:
+        self._model.setStringList([])
+        self._workitems.clear()
+        self._row_by_uid.clear()
+
+    def _load(self) -> None:
+        self._workitems.clear()
+        source = self._source_holder.get_source()
+        if source is not None:
+            self._workitems.extend(wi for wi in source.workitems()
+                                   if not self._hide_completed or not wi.is_sealed())
+        self._reindex()
+        self._model.setStringList([wi.get_name() for wi in self._workitems])
+
+    def _reindex(self) -> None:
+        self._row_by_uid = {wi.get_uid(): i for i, wi in enumerate(self._workitems)}
+
+    def _find_row(self, workitem: Workitem) -> int:
+        return self._row_by_uid.get(workitem.get_uid(), -1)
+
+    def _add_workitem(self, workitem: Workitem) -> None:
+        if self._hide_completed and workitem.is_sealed():
+            return
+        row = len(self._workitems)
+        self._workitems.append(workitem)
+        self._row_by_uid[workitem.get_uid()] = row
+        self._model.insertRows(row, 1)
+        self._model.setData(self._model.index(row), workitem.get_name())
+
+    def _remove_workitem(self, workitem: Workitem) -> None:
+        row = self._find_row(workitem)
+        if row >= 0:
+            del self._workitems[row]
+            self._reindex()     # Rows below the removed one shift up
+            self._model.removeRows(row, 1)
+
+    def _workitem_created(self, workitem: Workitem, **kwargs) -> None:
+        self._add_workitem(workitem)
+
+    def _workitem_deleted(self, workitem: Workitem, **kwargs) -> None:
+        self._remove_workitem(workitem)
+
+    def _workitem_renamed(self, workitem: Workitem, new_name: str, **kwargs) -> None:
+        row = self._find_row(workitem)
+        if row >= 0:
+            self._model.setData(self._model.index(row), new_name)
+
+    def _workitem_completed(self, workitem: Workitem, **kwargs) -> None:
+        if self._hide_completed:
+            self._remove_workitem(workitem)
 
     def _select(self, index: QModelIndex):
-        workitem: Workitem = index.data(500)
+        # The index comes from the completer's filtered proxy, so map it back to our rows
+        row = self.completer().completionModel().mapToSource(index).row()
+        if row < 0 or row >= len(self._workitems):
+            return
+        workitem: Workitem = self._workitems[row]
         backlog: Backlog = workitem.get_parent()
         self._backlogs_table.select(backlog)
         # Queue the second selection step, as AfterSelectionChanged
@@ -68,23 +153,6 @@ class SearchBar(QtWidgets.QLineEdit):
         self.hide()
 
     def show(self) -> None:
-        completer = QtWidgets.QCompleter()
-        completer.setObjectName('search_completer')
-        completer.activated[QModelIndex].connect(lambda index: self._select(index))
-        completer.setFilterMode(QtGui.Qt.MatchFlag.MatchContains)
-        completer.setCaseSensitivity(QtGui.Qt.CaseSensitivity.CaseInsensitive)
-
-        model = QStandardItemModel()
-        for wi in self._source_holder.get_source().workitems():
-            if self._hide_completed and wi.is_sealed():
-                continue
-            item = QStandardItem()
-            item.setText(wi.get_name())
-            item.setData(wi, 500)
-            model.appendRow(item)
-        completer.setModel(model)
-
-        self.setCompleter(completer)
         self.setFocus()
         if not self.isVisible():
             self.setText("")
@@ -97,4 +165,7 @@ class SearchBar(QtWidgets.QLineEdit):
         return False
 
     def hide_completed(self, hide: bool) -> None:
-        self._hide_completed = hide
+        if self._hide_completed != hide:
+            self._hide_completed = hide
+            # That's a rare user action, so it's fine to rebuild the whole model here
+            self._load()
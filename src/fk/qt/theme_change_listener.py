@@ -15,7 +15,7 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import logging
 
-from PySide6.QtCore import QObject, QEvent
+from PySide6.QtCore import QObject
 from PySide6.QtGui import Qt
 from PySide6.QtWidgets import QMainWindow, QApplication
 
@@ -24,30 +24,30 @@ from fk.core.abstract_settings import AbstractSettings
 logger = logging.getLogger(__name__)
 
 
-class ThemeChangeEventFilter(QMainWindow):
+# Listens to the QStyleHints.colorSchemeChanged signal and turns it into a settings change event, so that
+# the "auto" theme follows the OS. This is not an event filter, so we don't route every window event through Python.
+class ThemeChangeListener(QObject):
     _window: QMainWindow
     _settings: AbstractSettings
 
-    # We need to use it, because Windows sometimes triggers dozens of ThemeChange events at once, and
+    # We need to use it, because Windows sometimes reports the same color scheme change many times, and
     #  we don't want to translate all of them into our settings change events, which might be too slow.
     _last_value: Qt.ColorScheme
 
     def __init__(self,
                  window: QMainWindow,
                  settings: AbstractSettings):
-        super().__init__()
+        super().__init__(window)
         self._window = window
         self._settings = settings
         self._last_value = QApplication.styleHints().colorScheme()
-
-    def eventFilter(self, widget: QObject, event: QEvent) -> bool:
-        if event.type() == QEvent.Type.ThemeChange and widget == self._window:
-            if self._settings.get('Application.theme') == 'auto':
-                new_theme = QApplication.styleHints().colorScheme()
-                logger.debug(f'Theme changed from {self._last_value} to {new_theme}')
-                if new_theme != self._last_value:
-                    self._settings.set({
-                        'Application.theme': 'auto'
-                    }, force_fire=True)
-                    self._last_value = new_theme
-        return False
+        QApplication.styleHints().colorSchemeChanged.connect(self._on_color_scheme_changed)
+
+    def _on_color_scheme_changed(self, new_theme: Qt.ColorScheme) -> None:
+        if self._settings.get('Application.theme') == 'auto':
+            logger.debug(f'Theme changed from {self._last_value} to {new_theme}')
+            if new_theme != self._last_value:
+                self._settings.set({
+                    'Application.theme': 'auto'
+                }, force_fire=True)
+                self._last_value = new_theme
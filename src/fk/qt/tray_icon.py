@@ -33,6 +33,7 @@ class TrayIcon(QSystemTrayIcon, AbstractTimerDisplay):
     _about_window: QMainWindow
     _default_icon: QIcon
     _next_icon: QIcon
+    _idle_icon: QPixmap | None
     _actions: Actions
     _timer_renderer: AbstractTimerRenderer | None
     _continue_workitem: Workitem | None
@@ -56,6 +57,7 @@ class TrayIcon(QSystemTrayIcon, AbstractTimerDisplay):
             self._next_icon = QIcon(':/icons/light/24x24/tool-next.svg')
         self._actions = actions
         self._continue_workitem = None
+        self._idle_icon = None
         self._timer_renderer = cls(None,
                                    QColor('#000000' if is_dark else '#ffffff'),
                                    QColor('#ffffff' if is_dark else '#000000'),
@@ -90,8 +92,11 @@ class TrayIcon(QSystemTrayIcon, AbstractTimerDisplay):
     def reset(self):
         self.setToolTip("It's time for the next Pomodoro.")
         if self._timer_renderer.has_idle_display():
-            self._timer_renderer.set_values(0, 1, None, None, 'idle')
-            self.paint()
+            # The idle icon never changes, so we render it only once
+            if self._idle_icon is None:
+                self._timer_renderer.set_values(0, 1, None, None, 'idle')
+                self._idle_icon = self._render()
+            self.setIcon(self._idle_icon)
         else:
             self.setIcon(self._default_icon)
 
@@ -107,14 +112,18 @@ class TrayIcon(QSystemTrayIcon, AbstractTimerDisplay):
             if 'window.showMainWindow' in self._actions:
                 self._actions['window.showMainWindow'].trigger()
 
-    def paint(self) -> None:
+    def _render(self) -> QPixmap:
         tray_width = 48 if self._size is None else self._size
         tray_height = 48 if self._size is None else self._size
         pixmap = QPixmap(tray_width, tray_height)
         pixmap.fill(Qt.GlobalColor.transparent)
         painter = QPainter(pixmap)
         self._timer_renderer.repaint(painter, QRect(0, 0, tray_width, tray_height))
-        self.setIcon(pixmap)
+        painter.end()
+        return pixmap
+
+    def paint(self) -> None:
+        self.setIcon(self._render())
 
     def tick(self, pomodoro: Pomodoro, state_text: str, my_value: float, my_max: float, mode: str) -> None:
         self.setToolTip(f"{state_text} ({pomodoro.get_parent().get_name()})")
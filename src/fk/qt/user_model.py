@@ -16,24 +16,36 @@
 import datetime
 
 from PySide6 import QtGui, QtCore
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QModelIndex
 
 from fk.core import events
 from fk.core.abstract_event_source import AbstractEventSource
 from fk.core.event_source_holder import EventSourceHolder, AfterSourceChanged
 from fk.core.tenant import Tenant
 from fk.core.user import User
+from fk.qt.item_roles import ROLE_OBJECT, ROLE_TYPE
 
 
-class UserModel(QtGui.QStandardItemModel):
+# A flat list of users doesn't need a QStandardItem per row, so we serve the data directly from Python
+class UserModel(QtCore.QAbstractListModel):
     _font_normal: QtGui.QFont
     _font_busy: QtGui.QFont
+    _state_font: dict[str, QtGui.QFont]
+    _users: list[User]
+    _row_by_user: dict[str, int]
+    _display: dict[str, tuple[str, QtGui.QFont]]
 
     def __init__(self, parent: QtCore.QObject, source_holder: EventSourceHolder):
-        super().__init__(0, 1, parent)
+        super().__init__(parent)
         self._font_normal = QtGui.QFont()
         self._font_busy = QtGui.QFont()
         self._font_busy.setBold(True)
+        self._state_font = {
+            'Focus': self._font_busy,
+        }
+        self._users = list()
+        self._row_by_user = dict()
+        self._display = dict()
         source_holder.on(AfterSourceChanged, self._on_source_changed)
 
     def _on_source_changed(self, event: str, source: AbstractEventSource):
@@ -46,50 +58,79 @@ class UserModel(QtGui.QStandardItemModel):
         self.load(source.get_data())
 
     def _user_added(self, event: str, user: User) -> None:
-        item = QtGui.QStandardItem('')
-        self.appendRow(item)
-        self.set_row(self.rowCount() - 1, user)
+        row = len(self._users)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._users.append(user)
+        self._row_by_user[user.get_uid()] = row
+        self._update_display(user)
+        self.endInsertRows()
 
     def _user_removed(self, event: str, user: User) -> None:
-        for i in range(self.rowCount()):
-            u = self.item(i).data(500)
-            if u == user:
-                self.removeRow(i)
-                return
+        row = self._row_by_user.get(user.get_uid())
+        if row is not None:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._users[row]
+            del self._display[user.get_uid()]
+            # Rows below the removed one shift up. Removing users is rare, so we simply reindex.
+            self._row_by_user = {u.get_uid(): i for i, u in enumerate(self._users)}
+            self.endRemoveRows()
 
     def _user_renamed(self, event: str, user: User, old_name: str, new_name: str) -> None:
-        for i in range(self.rowCount()):
-            u = self.item(i).data(500)
-            if u == user:
-                self.set_row(i, u)
-                return
+        if old_name == new_name:
+            return
+        row = self._row_by_user.get(user.get_uid())
+        if row is not None:
+            roles = self._update_display(user)
+            if len(roles) > 0:
+                index = self.index(row, 0)
+                self.dataChanged.emit(index, index, roles)
 
-    def set_row(self, i: int, user: User) -> None:
+    def _update_display(self, user: User) -> list[int]:
+        # We take a snapshot of the state, as computing it on every data() call is expensive. Returns
+        # the roles which changed, so that we don't emit dataChanged and repaint the views needlessly.
         state, remaining = user.get_state(datetime.datetime.now(datetime.timezone.utc))
-        font = self._font_busy if state == 'Focus' else self._font_normal
-
-        col1 = QtGui.QStandardItem()
         if state == 'Idle':
             txt = f'{user.get_name()}'
         else:
             txt = f'{user.get_name()}: {state}, {remaining} left'
-        col1.setData(txt, Qt.ItemDataRole.DisplayRole)
-        col1.setData(font, Qt.ItemDataRole.FontRole)
-        col1.setData(user, 500)
-        col1.setData('title', 501)
-        col1.setData(txt, Qt.ItemDataRole.ToolTipRole)
-        col1.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-        self.setItem(i, 0, col1)
+        font = self._state_font.get(state, self._font_normal)
+        old_txt, old_font = self._display.get(user.get_uid(), (None, None))
+        self._display[user.get_uid()] = (txt, font)
+        roles = list()
+        if old_txt != txt:
+            roles.append(Qt.ItemDataRole.DisplayRole)
+            roles.append(Qt.ItemDataRole.ToolTipRole)
+        if old_font is not font:
+            roles.append(Qt.ItemDataRole.FontRole)
+        return roles
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._users)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> any:
+        if not index.isValid() or index.row() >= len(self._users):
+            return None
+        user = self._users[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.ToolTipRole:
+            return self._display[user.get_uid()][0]
+        elif role == Qt.ItemDataRole.FontRole:
+            return self._display[user.get_uid()][1]
+        elif role == ROLE_OBJECT:
+            return user
+        elif role == ROLE_TYPE:
+            return 'title'
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
 
     def load(self, app: Tenant) -> None:
-        self.clear()
+        self.beginResetModel()
+        self._users.clear()
+        self._display.clear()
         if app is not None:
-            i = 0
-            for user in app.values():
-                if user.is_system_user():
-                    continue
-                item = QtGui.QStandardItem('')
-                self.appendRow(item)
-                self.set_row(i, user)
-                i += 1
-        self.setHorizontalHeaderItem(0, QtGui.QStandardItem(''))
+            self._users.extend(app.non_system_users())
+            for user in self._users:
+                self._update_display(user)
+        self._row_by_user = {u.get_uid(): i for i, u in enumerate(self._users)}
+        self.endResetModel()
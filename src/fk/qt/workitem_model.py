@@ -27,6 +27,7 @@ from fk.core.tag import Tag
 from fk.core.workitem import Workitem
 from fk.core.workitem_strategies import RenameWorkitemStrategy, ReorderWorkitemStrategy
 from fk.qt.abstract_drop_model import AbstractDropModel
+from fk.qt.item_roles import ROLE_OBJECT, ROLE_TYPE
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +38,8 @@ class WorkitemPlanned(QtGui.QStandardItem):
     def __init__(self, workitem: Workitem, font: QtGui.QFont):
         super().__init__()
         self._workitem = workitem
-        self.setData(workitem, 500)
-        self.setData('planned', 501)
+        self.setData(workitem, ROLE_OBJECT)
+        self.setData('planned', ROLE_TYPE)
         flags = (Qt.ItemFlag.ItemIsSelectable |
                  Qt.ItemFlag.ItemIsEnabled)
         self.setFlags(flags)
@@ -59,8 +60,8 @@ class WorkitemTitle(QtGui.QStandardItem):
     def __init__(self, workitem: Workitem, font: QtGui.QFont):
         super().__init__()
         self._workitem = workitem
-        self.setData(workitem, 500)
-        self.setData('title', 501)
+        self.setData(workitem, ROLE_OBJECT)
+        self.setData('title', ROLE_TYPE)
         self.update_display()
         self.update_font(font)
         self.update_flags()
@@ -89,8 +90,8 @@ class WorkitemPomodoro(QtGui.QStandardItem):
         super().__init__()
         self._workitem = workitem
         self._row_height = row_height
-        self.setData(workitem, 500)
-        self.setData('pomodoro', 501)
+        self.setData(workitem, ROLE_OBJECT)
+        self.setData('pomodoro', ROLE_TYPE)
         flags = (Qt.ItemFlag.ItemIsSelectable |
                  Qt.ItemFlag.ItemIsEnabled)
         self.setFlags(flags)
@@ -134,7 +135,7 @@ class WorkitemModel(AbstractDropModel):
         #  The right way to do it is by using QStandardItem subclass, like we do for BacklogModel
         # for i in range(self.rowCount()):
         #     item: QStandardItem = self.item(i, 2)
-        #     workitem: Workitem = item.data(500)
+        #     workitem: Workitem = item.data(ROLE_OBJECT)
         #     item.setData(QSize(len(workitem) * rh, rh), Qt.ItemDataRole.SizeHintRole)
         #     self.setItem(i, 2, item)
 
@@ -149,8 +150,8 @@ class WorkitemModel(AbstractDropModel):
         source.on('AfterPomodoro*', self._workitem_changed)
 
     def _handle_rename(self, item: QtGui.QStandardItem) -> None:
-        if item.data(501) == 'title':
-            workitem: Workitem = item.data(500)
+        if item.data(ROLE_TYPE) == 'title':
+            workitem: Workitem = item.data(ROLE_OBJECT)
             old_name = workitem.get_name()
             new_name = item.text()
             if old_name != new_name:
@@ -175,11 +176,7 @@ class WorkitemModel(AbstractDropModel):
         self.appendRow(self._item_for_object(workitem))
 
     def _find_workitem(self, workitem: Workitem) -> int:
-        for i in range(self.rowCount()):
-            wi = self.item(i).data(500)  # 500 ~ Qt.UserRole + 1
-            if wi == workitem:
-                return i
-        return -1
+        return self.find_row(workitem)
 
     def _remove_if_found(self, workitem: Workitem) -> None:
         i = self._find_workitem(workitem)
@@ -219,7 +216,7 @@ class WorkitemModel(AbstractDropModel):
     def _workitem_changed(self, workitem: Workitem, **kwargs) -> None:
         for i in range(self.rowCount()):
             item0: WorkitemPlanned = self.item(i, 0)
-            wi = item0.data(500)
+            wi = item0.data(ROLE_OBJECT)
             if wi == workitem:
                 if self._hide_completed and workitem.is_sealed():
                     self.removeRow(i)
@@ -13,7 +13,11 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from PySide6.QtCore import Qt, QModelIndex
+import functools
+from typing import Callable
+
+from PySide6.QtCore import Qt, QModelIndex, QPoint
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QWidget, QHeaderView, QMenu, QMessageBox
 
 from fk.core.abstract_data_item import generate_unique_name, generate_uid
@@ -33,9 +37,26 @@ from fk.qt.workitem_model import WorkitemModel
 from fk.qt.workitem_text_delegate import WorkitemTextDelegate
 
 
+def _require_selection(error: str):
+    # Passes the currently selected workitem to the decorated action, or fails if there's none selected.
+    # Actions visibility should prevent the latter from happening.
+    def decorator(fn: Callable[['WorkitemTableView', Workitem], None]) -> Callable[['WorkitemTableView'], None]:
+        @functools.wraps(fn)
+        def wrapper(self: 'WorkitemTableView') -> None:
+            selected: Workitem = self.get_current()
+            if selected is None:
+                raise Exception(error)
+            return fn(self, selected)
+        return wrapper
+    return decorator
+
+
 class WorkitemTableView(AbstractTableView[Backlog | Tag, Workitem]):
     _application: Application
-    _menu: QMenu
+    _menu: QMenu | None
+    _selection_dependent: tuple[QAction, ...]
+    _last_enabled: tuple[bool, ...] | None
+    _confirmation: QMessageBox | None
 
     def __init__(self,
                  parent: QWidget,
@@ -52,8 +73,21 @@ class WorkitemTableView(AbstractTableView[Backlog | Tag, Workitem]):
                          'The selected backlog is empty.\nCreate the first workitem by pressing Ins key.',
                          1)
         self._application = application
+        # The order matches the flags computed in update_actions()
+        self._selection_dependent = (
+            actions['workitems_table.deleteItem'],
+            actions['workitems_table.renameItem'],
+            actions['workitems_table.startItem'],
+            actions['workitems_table.completeItem'],
+            actions['workitems_table.addPomodoro'],
+            actions['workitems_table.removePomodoro'],
+        )
+        self._last_enabled = None
+        self._confirmation = None
         self._configure_delegate()
-        self._menu = self._init_menu(actions)
+        self._menu = None   # Created on the first right-click
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(self._show_menu)
         source_holder.on(AfterSourceChanged, self._on_source_changed)
         self.update_actions(None)
         application.get_settings().on(AfterSettingsChanged, self._on_setting_changed)
@@ -96,7 +130,8 @@ class WorkitemTableView(AbstractTableView[Backlog | Tag, Workitem]):
         self.selectionModel().clear()
         self.upstream_selected(None)
 
-    def _init_menu(self, actions: Actions) -> QMenu:
+    def _init_menu(self) -> QMenu:
+        actions = self._actions
         menu: QMenu = QMenu()
         menu.addActions([
             actions['workitems_table.newItem'],
@@ -108,10 +143,13 @@ class WorkitemTableView(AbstractTableView[Backlog | Tag, Workitem]):
             actions['workitems_table.hideCompleted'],
             actions['workitems_table.completeItem'],
         ])
-        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.customContextMenuRequested.connect(lambda p: menu.exec(self.mapToGlobal(p)))
         return menu
 
+    def _show_menu(self, pos: QPoint) -> None:
+        if self._menu is None:
+            self._menu = self._init_menu()
+        self._menu.exec(self.mapToGlobal(pos))
+
     @staticmethod
     def define_actions(actions: Actions):
         actions.add('workitems_table.newItem', "New Item", 'Ins', "tool-add", WorkitemTableView.create_workitem)
@@ -141,12 +179,22 @@ class WorkitemTableView(AbstractTableView[Backlog | Tag, Workitem]):
         # TODO: Call this on any workitem and timer event
         is_workitem_selected = selected is not None
         is_workitem_editable = is_workitem_selected and not selected.is_sealed()
-        self._actions['workitems_table.deleteItem'].setEnabled(is_workitem_selected)
-        self._actions['workitems_table.renameItem'].setEnabled(is_workitem_editable)
-        self._actions['workitems_table.startItem'].setEnabled(is_workitem_editable and selected.is_startable())
-        self._actions['workitems_table.completeItem'].setEnabled(is_workitem_editable)
-        self._actions['workitems_table.addPomodoro'].setEnabled(is_workitem_editable)
-        self._actions['workitems_table.removePomodoro'].setEnabled(is_workitem_editable and selected.is_startable())
+        is_workitem_startable = is_workitem_editable and selected.is_startable()
+        enabled = (
+            is_workitem_selected,   # deleteItem
+            is_workitem_editable,   # renameItem
+            is_workitem_startable,  # startItem
+            is_workitem_editable,   # completeItem
+            is_workitem_editable,   # addPomodoro
+            is_workitem_startable,  # removePomodoro
+        )
+        # This is called on every selection change and workitem / pomodoro event, while the
+        # result rarely changes. Skip setEnabled() calls, as each one might emit QAction.changed.
+        if enabled == self._last_enabled:
+            return
+        self._last_enabled = enabled
+        for action, is_enabled in zip(self._selection_dependent, enabled):
+            action.setEnabled(is_enabled)
 
     # Actions
 
@@ -182,22 +230,25 @@ class WorkitemTableView(AbstractTableView[Backlog | Tag, Workitem]):
             raise Exception("Trying to rename a workitem, while there's none selected")
         self.edit(index)
 
-    def delete_selected_workitem(self) -> None:
-        selected: Workitem = self.get_current()
-        if selected is None:
-            raise Exception("Trying to delete a workitem, while there's none selected")
-        if QMessageBox().warning(self,
-                                 "Confirmation",
-                                 f"Are you sure you want to delete workitem '{selected.get_name()}'?",
-                                 QMessageBox.StandardButton.Ok,
-                                 QMessageBox.StandardButton.Cancel
-                                 ) == QMessageBox.StandardButton.Ok:
+    def _confirm(self, text: str) -> bool:
+        # We reuse the same dialog instead of creating a new one every time
+        if self._confirmation is None:
+            self._confirmation = QMessageBox(QMessageBox.Icon.Warning,
+                                             "Confirmation",
+                                             "",
+                                             QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Cancel,
+                                             self)
+        self._confirmation.setText(text)
+        self._confirmation.setDefaultButton(QMessageBox.StandardButton.Ok)
+        return self._confirmation.exec() == QMessageBox.StandardButton.Ok
+
+    @_require_selection("Trying to delete a workitem, while there's none selected")
+    def delete_selected_workitem(self, selected: Workitem) -> None:
+        if self._confirm(f"Are you sure you want to delete workitem '{selected.get_name()}'?"):
             self._source.execute(DeleteWorkitemStrategy, [selected.get_uid()])
 
-    def start_selected_workitem(self) -> None:
-        selected: Workitem = self.get_current()
-        if selected is None:
-            raise Exception("Trying to start a workitem, while there's none selected")
+    @_require_selection("Trying to start a workitem, while there's none selected")
+    def start_selected_workitem(self, selected: Workitem) -> None:
         settings = self._source.get_settings()
         self._source.execute(StartWorkStrategy, [
             selected.get_uid(),
@@ -205,32 +256,21 @@ class WorkitemTableView(AbstractTableView[Backlog | Tag, Workitem]):
             settings.get('Pomodoro.default_rest_duration'),
         ])
 
-    def complete_selected_workitem(self) -> None:
-        selected: Workitem = self.get_current()
-        if selected is None:
-            raise Exception("Trying to complete a workitem, while there's none selected")
-        if not selected.has_running_pomodoro() or QMessageBox().warning(
-                self,
-                "Confirmation",
-                f"Are you sure you want to complete current workitem? This will void current pomodoro.",
-                QMessageBox.StandardButton.Ok,
-                QMessageBox.StandardButton.Cancel
-                ) == QMessageBox.StandardButton.Ok:
+    @_require_selection("Trying to complete a workitem, while there's none selected")
+    def complete_selected_workitem(self, selected: Workitem) -> None:
+        if not selected.has_running_pomodoro() or self._confirm(
+                "Are you sure you want to complete current workitem? This will void current pomodoro."):
             self._source.execute(CompleteWorkitemStrategy, [selected.get_uid(), "finished"])
 
-    def add_pomodoro(self) -> None:
-        selected: Workitem = self.get_current()
-        if selected is None:
-            raise Exception("Trying to add pomodoro to a workitem, while there's none selected")
+    @_require_selection("Trying to add pomodoro to a workitem, while there's none selected")
+    def add_pomodoro(self, selected: Workitem) -> None:
         self._source.execute(AddPomodoroStrategy, [
             selected.get_uid(),
             "1"
         ])
 
-    def remove_pomodoro(self) -> None:
-        selected: Workitem = self.get_current()
-        if selected is None:
-            raise Exception("Trying to remove pomodoro from a workitem, while there's none selected")
+    @_require_selection("Trying to remove pomodoro from a workitem, while there's none selected")
+    def remove_pomodoro(self, selected: Workitem) -> None:
         self._source.execute(RemovePomodoroStrategy, [
             selected.get_uid(),
             "1"
@@ -242,9 +282,13 @@ class WorkitemTableView(AbstractTableView[Backlog | Tag, Workitem]):
         self._source.set_config_parameters({'Application.hide_completed': str(checked)})
 
     def _resize(self) -> None:
-        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        self.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        # Suppress intermediate header updates while we set the modes one by one
+        header = self.horizontalHeader()
+        header.setUpdatesEnabled(False)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        header.setUpdatesEnabled(True)
 
         # Resizing to contents results in visible blinking on Kubuntu 20.04, so cannot be enabled by default.
         self.verticalHeader().setSectionResizeMode(
@@ -21,6 +21,7 @@ from PySide6.QtCore import QSize, Qt, QRect
 from PySide6.QtGui import QTextDocument
 
 from fk.core.workitem import Workitem
+from fk.qt.item_roles import ROLE_OBJECT, ROLE_TYPE
 
 TAG_REGEX = re.compile('#(\\w+)')
 
@@ -48,14 +49,14 @@ class WorkitemTextDelegate(QtWidgets.QItemDelegate):
                 f'</span>')
 
     def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
-        if index.data(501) == 'title':  # We can also get a drop placeholder here, which we don't want to paint
+        if index.data(ROLE_TYPE) == 'title':  # We can also get a drop placeholder here, which we don't want to paint
             painter.save()
             painter.translate(option.rect.topLeft())
 
             document = QTextDocument(self)
             document.setTextWidth(option.rect.width())
 
-            workitem: Workitem = index.data(500)
+            workitem: Workitem = index.data(ROLE_OBJECT)
             document.setHtml(self._format_html(workitem))
             document.drawContents(painter)
 
@@ -88,15 +88,15 @@ class TestBacklogs(TestCase):
     def test_create_duplicate_backlog_failure(self):
         self.source.execute(CreateBacklogStrategy, ['123-456-789-1', 'First backlog 1'])
         self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(CreateBacklogStrategy, ['123-456-789-1', 'First backlog 2']))
+        with self.assertRaises(Exception):
+            self.source.execute(CreateBacklogStrategy, ['123-456-789-1', 'First backlog 2'])
 
     def test_rename_nonexistent_backlog_failure(self):
         self.source.execute(CreateBacklogStrategy, ['123-456-789-1', 'First backlog'])
         self.source.execute(CreateBacklogStrategy, ['123-456-789-2', 'Second backlog'])
         self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(RenameBacklogStrategy, ['123-456-789-3', 'Renamed backlog']))
+        with self.assertRaises(Exception):
+            self.source.execute(RenameBacklogStrategy, ['123-456-789-3', 'Renamed backlog'])
 
     def test_rename_backlog(self):
         self.source.execute(CreateBacklogStrategy, ['123-456-789-1', 'First backlog'])
@@ -109,8 +109,8 @@ class TestBacklogs(TestCase):
         self.source.execute(CreateBacklogStrategy, ['123-456-789-1', 'First backlog'])
         self.source.execute(CreateBacklogStrategy, ['123-456-789-2', 'Second backlog'])
         self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(DeleteBacklogStrategy, ['123-456-789-3']))
+        with self.assertRaises(Exception):
+            self.source.execute(DeleteBacklogStrategy, ['123-456-789-3'])
 
     def test_delete_backlog(self):
         self.source.execute(CreateBacklogStrategy, ['123-456-789-1', 'First backlog'])
@@ -137,7 +137,7 @@ class TestBacklogs(TestCase):
         # Subscribe to all events and check that only required ones fire
         # Ephemeral event source is synchronous, so it's alright that we don't add any delays here
         state = 0
-        fired = list()
+        fired = []
         def on_event(event, **kwargs):
             self.assertNotIn(state, [0, 2])
             self.assertIn(event, ['BeforeMessageProcessed', 'BeforeBacklogCreate', 'AfterBacklogCreate', 'AfterMessageProcessed'])
@@ -165,7 +165,7 @@ class TestBacklogs(TestCase):
 
     def test_events_delete_backlog(self):
         # Here we shall also test the recursive deletion
-        fired = list()
+        fired = []
         def on_event(event, **kwargs):
             fired.append(event)
             if event == 'BeforeBacklogDelete' or event == 'AfterBacklogDelete':
@@ -203,7 +203,7 @@ class TestBacklogs(TestCase):
         # Automatic voiding of pomodoros will be tested when we cover the lifecycles
 
     def test_events_rename_backlog(self):
-        fired = list()
+        fired = []
         def on_event(event, **kwargs):
             fired.append(event)
             if event == 'BeforeBacklogRename' or event == 'AfterBacklogRename':
@@ -14,6 +14,8 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import os
+import shutil
+import tempfile
 from unittest import TestCase
 
 from fk.core.abstract_cryptograph import AbstractCryptograph
@@ -24,7 +26,7 @@ from fk.core.mock_settings import MockSettings
 from fk.core.tenant import Tenant
 from fk.core.user import User
 
-TEMP_FILENAME = 'src/fk/tests/fixtures/flowkeeper-data-TEMP.txt'
+TEMP_FILE = 'flowkeeper-data-TEMP.txt'
 
 
 class TestFileEventSource(TestCase):
@@ -32,16 +34,19 @@ class TestFileEventSource(TestCase):
     cryptograph: AbstractCryptograph
     source: FileEventSource
     data: dict[str, User]
+    temp_dir: str
 
     def setUp(self) -> None:
-        self.settings = MockSettings(filename=TEMP_FILENAME)
+        # Each test gets its own directory, so that the suite can run in parallel
+        self.temp_dir = tempfile.mkdtemp(prefix='flowkeeper-test-')
+        self.settings = MockSettings(filename=os.path.join(self.temp_dir, TEMP_FILE))
         self.cryptograph = FernetCryptograph(self.settings)
         self.source = FileEventSource[Tenant](self.settings, self.cryptograph, Tenant(self.settings))
         self.source.start()
         self.data = self.source.get_data()
 
     def tearDown(self) -> None:
-        os.unlink(TEMP_FILENAME)
+        shutil.rmtree(self.temp_dir)
 
     def test_initialize(self):
         self.assertIn('user@local.host', self.data)
@@ -47,8 +47,8 @@ class TestSettings(TestCase):
         self.assertEqual(val2, 'focus')
 
     def test_invalid_setting(self):
-        self.assertRaises(Exception,
-                          lambda: self.settings.get('Invalid.name'))
+        with self.assertRaises(KeyError):
+            self.settings.get('Invalid.name')
 
     def test_categories(self):
         categories = self.settings.get_categories()
@@ -72,6 +72,13 @@ class TestSettings(TestCase):
         })
         self.assertEqual(self.settings.get('Pomodoro.default_work_duration'), '11')
 
+    def test_get_bool(self):
+        self.assertTrue(self.settings.get_bool('Application.show_toolbar'))
+        self.settings.set({
+            'Application.show_toolbar': 'False',
+        })
+        self.assertFalse(self.settings.get_bool('Application.show_toolbar'))
+
     def test_clear(self):
         # What's the difference between this and reset_to_defaults()?
         self.settings.set({
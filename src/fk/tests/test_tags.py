@@ -19,12 +19,11 @@ from unittest import TestCase
 from fk.core.abstract_cryptograph import AbstractCryptograph
 from fk.core.abstract_settings import AbstractSettings
 from fk.core.backlog import Backlog
-from fk.core.backlog_strategies import CreateBacklogStrategy, RenameBacklogStrategy, DeleteBacklogStrategy
+from fk.core.backlog_strategies import CreateBacklogStrategy
 from fk.core.ephemeral_event_source import EphemeralEventSource
 from fk.core.file_event_source import FileEventSource
 from fk.core.fernet_cryptograph import FernetCryptograph
 from fk.core.mock_settings import MockSettings
-from fk.core.pomodoro_strategies import AddPomodoroStrategy
 from fk.core.tag import Tag
 from fk.core.tags import Tags
 from fk.core.tenant import Tenant
@@ -56,10 +55,10 @@ class TestTags(TestCase):
         return user, user['b1']
 
     def _add_workitem(self, name: str, uid: str = 'w11') -> Workitem:
-        self._standard_backlog()
+        _, backlog = self._standard_backlog()
         self.source.execute(CreateWorkitemStrategy, [uid, 'b1', name])
         self.source.auto_seal()
-        return self.data['user@local.host']['b1'][uid]
+        return backlog[uid]
 
     def _delete_workitem(self, uid: str) -> None:
         self.source.execute(DeleteWorkitemStrategy, [uid])
@@ -360,7 +359,7 @@ class TestTags(TestCase):
 
     # - Events: TagDeleted
     def test_tag_deleted_event(self):
-        fired = list()
+        fired = []
 
         def on_event(event, **kwargs):
             fired.append(event)
@@ -368,14 +367,14 @@ class TestTags(TestCase):
                 self.assertIn('tag', kwargs)
                 tag = kwargs['tag']
                 self.assertEqual(tag.get_uid(), 'deleted')
-                self.assertEqual(tag.get_parent().get_parent(), self.data['user@local.host'])
+                self.assertEqual(tag.get_parent().get_parent(), user)
             elif event == 'TagContentChanged':
                 self.assertIn('tag', kwargs)
                 tag = kwargs['tag']
                 self.assertEqual(tag.get_uid(), 'deleted')
                 self.assertEqual(len(tag.get_workitems()), 0)
 
-        self._standard_backlog()
+        user, _ = self._standard_backlog()
         self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'Tags #one, #two and #deleted'])
 
         self.source.on('*', on_event)
@@ -392,7 +391,7 @@ class TestTags(TestCase):
 
     # - Events: TagContentChanged
     def test_tag_content_changed_event(self):
-        fired = list()
+        fired = []
 
         def on_event(event, **kwargs):
             fired.append(event)
@@ -400,14 +399,14 @@ class TestTags(TestCase):
                 self.assertIn('tag', kwargs)
                 tag = kwargs['tag']
                 self.assertEqual(tag.get_uid(), 'new')
-                self.assertEqual(tag.get_parent().get_parent(), self.data['user@local.host'])
+                self.assertEqual(tag.get_parent().get_parent(), user)
             elif event == 'TagContentChanged':
                 self.assertIn('tag', kwargs)
                 tag = kwargs['tag']
                 self.assertEqual(tag.get_uid(), 'new')
                 self.assertEqual(len(tag.get_workitems()), 2)
 
-        self._standard_backlog()
+        user, _ = self._standard_backlog()
         self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', '#New workitem'])
 
         self.source.on('*', on_event)
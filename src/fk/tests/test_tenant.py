@@ -0,0 +1,84 @@
+#  Flowkeeper - Pomodoro timer for power users and teams
+#  Copyright (c) 2023 Constantine Kulak
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import datetime
+from unittest import TestCase
+
+from fk.core.abstract_cryptograph import AbstractCryptograph
+from fk.core.abstract_settings import AbstractSettings
+from fk.core.ephemeral_event_source import EphemeralEventSource
+from fk.core.fernet_cryptograph import FernetCryptograph
+from fk.core.mock_settings import MockSettings
+from fk.core.tenant import Tenant
+from fk.core.user import User
+
+
+class TestTenant(TestCase):
+    settings: AbstractSettings
+    cryptograph: AbstractCryptograph
+    source: EphemeralEventSource
+    data: Tenant
+
+    def setUp(self) -> None:
+        self.settings = MockSettings()
+        self.cryptograph = FernetCryptograph(self.settings)
+        self.source = EphemeralEventSource[Tenant](self.settings, self.cryptograph, Tenant(self.settings))
+        self.source.start()
+        self.data = self.source.get_data()
+
+    def _new_user(self, uid: str, name: str) -> User:
+        return User(self.data, uid, name, datetime.datetime.now(datetime.timezone.utc), False)
+
+    def test_current_user(self):
+        local_user = self.data.get_current_user()
+        self.assertEqual(local_user.get_uid(), 'user@local.host')
+        self.assertIs(self.data.get_current_user(), local_user)
+
+    def test_current_user_username_changed(self):
+        local_user = self.data.get_current_user()
+        self.data['alice@example.org'] = self._new_user('alice@example.org', 'Alice')
+        self.settings.set({
+            'Source.type': 'flowkeeper.org',
+            'WebsocketEventSource.username': 'admin@local.host',
+        })
+        self.assertEqual(self.data.get_current_user().get_uid(), 'admin@local.host')
+        # Only the username changes, the source type stays the same
+        self.settings.set({
+            'WebsocketEventSource.username': 'alice@example.org',
+        })
+        self.assertEqual(self.data.get_current_user().get_uid(), 'alice@example.org')
+        self.settings.set({
+            'Source.type': 'local',
+        })
+        self.assertIs(self.data.get_current_user(), local_user)
+
+    def test_current_user_recreated(self):
+        self.data.get_current_user()
+        del self.data['user@local.host']
+        with self.assertRaises(KeyError):
+            self.data.get_current_user()
+        recreated = self._new_user('user@local.host', 'Recreated')
+        self.data['user@local.host'] = recreated
+        self.assertIs(self.data.get_current_user(), recreated)
+
+    def test_non_system_users(self):
+        users = self.data.non_system_users()
+        self.assertEqual([u.get_uid() for u in users], ['user@local.host'])
+        self.assertIs(self.data.non_system_users(), users)
+        self.data['alice@example.org'] = self._new_user('alice@example.org', 'Alice')
+        self.assertEqual([u.get_uid() for u in self.data.non_system_users()],
+                         ['user@local.host', 'alice@example.org'])
+        del self.data['alice@example.org']
+        self.assertEqual([u.get_uid() for u in self.data.non_system_users()], ['user@local.host'])
@@ -30,22 +30,37 @@ from fk.core.workitem import Workitem
 from fk.core.workitem_strategies import CreateWorkitemStrategy, RenameWorkitemStrategy, DeleteWorkitemStrategy, \
     CompleteWorkitemStrategy
 
+# Prepared strategies only need some tz-aware timestamp, so all tests can reuse the same one
+NOW = datetime.datetime.now(datetime.timezone.utc)
+
 
 class TestWorkitems(TestCase):
     settings: AbstractSettings
     cryptograph: AbstractCryptograph
     source: EphemeralEventSource
     data: dict[str, User]
+    user: User
+    backlog: Backlog
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # None of the tests here change the settings, so they can share them. The only
+        # settings subscriber is the cryptograph, which is shared as well.
+        cls.settings = MockSettings()
+        cls.cryptograph = FernetCryptograph(cls.settings)
 
     def setUp(self) -> None:
-        self.settings = MockSettings()
-        self.cryptograph = FernetCryptograph(self.settings)
+        self._start_source()
+
+    def _start_source(self) -> None:
         self.source = EphemeralEventSource[Tenant](self.settings, self.cryptograph, Tenant(self.settings))
         self.source.start()
         self.data = self.source.get_data()
-
-    def tearDown(self) -> None:
-        self.source.dump()
+        # Every test needs a backlog. It has to be created anew each time, as the tests modify it.
+        self.source.execute(CreateBacklogStrategy, ['b1', 'First backlog'])
+        self.source.auto_seal()
+        self.user = self.data['user@local.host']
+        self.backlog = self.user['b1']
 
     def _assert_workitem(self, workitem1: Workitem, user: User, backlog: Backlog):
         self.assertEqual(workitem1.get_name(), 'First workitem')
@@ -59,15 +74,8 @@ class TestWorkitems(TestCase):
         self.assertTrue(workitem1.is_planned())
         self.assertEqual(len(workitem1.values()), 0)
         
-    def _standard_backlog(self) -> (User, Backlog): 
-        self.source.execute(CreateBacklogStrategy, ['b1', 'First backlog'])
-        self.source.auto_seal()
-        user = self.data['user@local.host']
-        backlog = user['b1']
-        return user, backlog
-
     def test_create_workitems(self):
-        user, backlog = self._standard_backlog()
+        user, backlog = self.user, self.backlog
         self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
         self.source.execute(CreateWorkitemStrategy, ['w12', 'b1', 'Second workitem'])
         self.source.auto_seal()
@@ -79,7 +87,7 @@ class TestWorkitems(TestCase):
         self.assertEqual(workitem2.get_name(), 'Second workitem')
 
     def test_create_workitems_with_tags(self):
-        user, backlog = self._standard_backlog()
+        user, backlog = self.user, self.backlog
         self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
         self.source.execute(CreateWorkitemStrategy, ['w12', 'b1', '#Second workitem'])
         self.source.execute(CreateWorkitemStrategy, ['w13', 'b1', '#Third #workitem'])
@@ -119,9 +127,9 @@ class TestWorkitems(TestCase):
         self.assertIn(workitem6, workitems)
 
     def test_execute_prepared(self):
-        user, backlog = self._standard_backlog()
+        user, backlog = self.user, self.backlog
         s = CreateWorkitemStrategy(2,
-                                  datetime.datetime.now(datetime.timezone.utc),
+                                  NOW,
                                   user.get_identity(),
                                   ['w11', 'b1', 'First workitem'],
                                   self.settings)
@@ -131,41 +139,16 @@ class TestWorkitems(TestCase):
         workitem1: Workitem = backlog['w11']
         self._assert_workitem(workitem1, user, backlog)
 
-    def test_create_duplicate_workitem_failure(self):
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem 1'])
-        self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem 2']))
-
-    def test_rename_nonexistent_workitem_failure(self):
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
-        self.source.execute(CreateWorkitemStrategy, ['w12', 'b1', 'Second workitem'])
-        self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(RenameWorkitemStrategy, ['w13', 'Renamed workitem']))
-
     def test_rename_workitem(self):
-        user, backlog = self._standard_backlog()
+        backlog = self.backlog
         self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
         self.source.execute(RenameWorkitemStrategy, ['w11', 'Renamed workitem'])
         self.source.auto_seal()
         self.assertEqual(backlog['w11'].get_name(), 'Renamed workitem')
 
-    def test_delete_nonexistent_workitem_failure(self):
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
-        self.source.execute(CreateWorkitemStrategy, ['w12', 'b1', 'Second workitem'])
-        self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(DeleteWorkitemStrategy, ['w13']))
-
     def test_delete_workitem(self):
-        user, backlog = self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
-        self.source.execute(CreateWorkitemStrategy, ['w12', 'b1', 'Second workitem'])
-        self.source.auto_seal()
+        backlog = self.backlog
+        self._two_workitems()
         self.assertIn('w11', backlog)
         self.source.execute(DeleteWorkitemStrategy, ['w11'])
         self.source.auto_seal()
@@ -173,7 +156,7 @@ class TestWorkitems(TestCase):
         self.assertIn('w12', backlog)
 
     def test_complete_workitem_basic(self):
-        user, backlog = self._standard_backlog()
+        backlog = self.backlog
         self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
         self.source.auto_seal()
         workitem = backlog['w11']
@@ -185,53 +168,67 @@ class TestWorkitems(TestCase):
         self.assertFalse(workitem.is_running())
         self.assertFalse(workitem.has_running_pomodoro())
 
-    def test_complete_workitem_invalid_state(self):
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
-        self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(CompleteWorkitemStrategy, ['w11', 'invalid']))
-
-    def test_complete_workitem_twice(self):
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
-        self.source.execute(CompleteWorkitemStrategy, ['w11', 'finished'])
-        self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(CompleteWorkitemStrategy, ['w11', 'finished']))
-
-    def test_rename_completed_workitem(self):
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'Before'])
-        self.source.execute(CompleteWorkitemStrategy, ['w11', 'finished'])
-        self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(RenameWorkitemStrategy, ['w11', 'After']))
-
-    def test_add_pomodoro_to_completed_workitem(self):
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'Before'])
-        self.source.execute(CompleteWorkitemStrategy, ['w11', 'finished'])
-        self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(AddPomodoroStrategy, ['w11', '1']))
-
     def test_delete_completed_workitem(self):
-        _, backlog = self._standard_backlog()
+        backlog = self.backlog
         self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'Before'])
         self.source.execute(CompleteWorkitemStrategy, ['w11', 'finished'])
         self.source.execute(DeleteWorkitemStrategy, ['w11'])
         self.source.auto_seal()
         self.assertNotIn('w11', backlog)
 
-    def test_start_completed_workitem(self):
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'Before'])
-        self.source.execute(AddPomodoroStrategy, ['w11', '1'])
-        self.source.execute(CompleteWorkitemStrategy, ['w11', 'finished'])
+    def _two_workitems(self) -> None:
+        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
+        self.source.execute(CreateWorkitemStrategy, ['w12', 'b1', 'Second workitem'])
         self.source.auto_seal()
-        self.assertRaises(Exception,
-                          lambda: self.source.execute(StartWorkStrategy, ['w11', '1', '1']))
+
+    def test_unknown_or_duplicate_workitem_fails(self):
+        # Those are rejected before anything changes, so all cases can share the same source
+        self._two_workitems()
+        cases = [
+            ('create duplicate', CreateWorkitemStrategy, ['w11', 'b1', 'Duplicate workitem']),
+            ('rename nonexistent', RenameWorkitemStrategy, ['w13', 'Renamed workitem']),
+            ('delete nonexistent', DeleteWorkitemStrategy, ['w13']),
+        ]
+        for description, strategy, params in cases:
+            with self.subTest(description):
+                with self.assertRaises(Exception):
+                    self.source.execute(strategy, params)
+        self.assertEqual(list(self.backlog.keys()), ['w11', 'w12'])
+        self.assertEqual(self.backlog['w11'].get_name(), 'First workitem')
+
+    def test_invalid_operations_fail(self):
+        # (description, preparation steps, the step which must fail)
+        cases = [
+            ('complete with invalid state',
+             [(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])],
+             (CompleteWorkitemStrategy, ['w11', 'invalid'])),
+            ('complete twice',
+             [(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem']),
+              (CompleteWorkitemStrategy, ['w11', 'finished'])],
+             (CompleteWorkitemStrategy, ['w11', 'finished'])),
+            ('rename completed',
+             [(CreateWorkitemStrategy, ['w11', 'b1', 'Before']),
+              (CompleteWorkitemStrategy, ['w11', 'finished'])],
+             (RenameWorkitemStrategy, ['w11', 'After'])),
+            ('add pomodoro to completed',
+             [(CreateWorkitemStrategy, ['w11', 'b1', 'Before']),
+              (CompleteWorkitemStrategy, ['w11', 'finished'])],
+             (AddPomodoroStrategy, ['w11', '1'])),
+            ('start completed',
+             [(CreateWorkitemStrategy, ['w11', 'b1', 'Before']),
+              (AddPomodoroStrategy, ['w11', '1']),
+              (CompleteWorkitemStrategy, ['w11', 'finished'])],
+             (StartWorkStrategy, ['w11', '1', '1'])),
+        ]
+        for description, steps, (failing_strategy, failing_params) in cases:
+            with self.subTest(description):
+                # Each case gets a clean source, as the steps would clash otherwise
+                self._start_source()
+                for strategy, params in steps:
+                    self.source.execute(strategy, params)
+                self.source.auto_seal()
+                with self.assertRaises(Exception):
+                    self.source.execute(failing_strategy, failing_params)
 
     # Next -- Test all workitem-specific stuff (check coverage)
     # - Lifecycle, including automatic voiding and completion of pomodoros (check all situations)
@@ -241,127 +238,104 @@ class TestWorkitems(TestCase):
     # - Check update timestamps
     # - Add (2), (3) and (4) to backlogs, too
 
-    def test_events_create_workitem(self):
-        fired = list()
-
-        def on_event(event, **kwargs):
-            fired.append(event)
-            if event == 'BeforeWorkitemCreate':
-                self.assertIn('workitem_uid', kwargs)
-                self.assertIn('backlog_uid', kwargs)
-                self.assertIn('workitem_name', kwargs)
-                self.assertEqual(kwargs['workitem_uid'], 'w11')
-                self.assertEqual(kwargs['backlog_uid'], 'b1')
-                self.assertEqual(kwargs['workitem_name'], 'First workitem')
-            elif event == 'AfterWorkitemCreate':
-                self.assertIn('workitem', kwargs)
-                self.assertTrue(type(kwargs['workitem']) is Workitem)
-
-        self._standard_backlog()
-        self.source.on('*', on_event)
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
-        self.source.auto_seal()
-        self.assertEqual(len(fired), 4)
-        self.assertEqual(fired[0], 'BeforeMessageProcessed')
-        self.assertEqual(fired[1], 'BeforeWorkitemCreate')
-        self.assertEqual(fired[2], 'AfterWorkitemCreate')
-        self.assertEqual(fired[3], 'AfterMessageProcessed')
-
-    def test_events_delete_workitem(self):
-        fired = list()
-
-        def on_event(event, **kwargs):
-            fired.append(event)
-            if event == 'BeforeWorkitemDelete' or event == 'AfterWorkitemDelete':
-                self.assertIn('workitem', kwargs)
-                self.assertTrue(type(kwargs['workitem']) is Workitem)
-                self.assertEqual(kwargs['workitem'].get_name(), 'First item')
-            elif event == 'BeforePomodoroComplete' or event == 'AfterPomodoroComplete':
-                self.assertIn('workitem', kwargs)
-                self.assertIn('target_state', kwargs)
-                self.assertTrue(type(kwargs['workitem']) is Workitem)
-                self.assertEqual(kwargs['workitem'].get_name(), 'First item')
-                self.assertEqual(kwargs['target_state'], 'canceled')
-
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First item'])
-        self.source.execute(AddPomodoroStrategy, ['w11', '2'])
-        self.source.execute(CreateWorkitemStrategy, ['w12', 'b1', 'Second item'])
-        self.source.execute(AddPomodoroStrategy, ['w11', '2'])
-        self.source.execute(StartWorkStrategy, ['w11', '1', '1'])
-        self.source.auto_seal()
-        self.source.on('*', on_event)  # We only care about delete here
-        self.source.execute(DeleteWorkitemStrategy, ['w11'])
-        self.source.auto_seal()
-        self.assertEqual(len(fired), 8)
-        self.assertEqual(fired[0], 'BeforeMessageProcessed')
-        self.assertEqual(fired[1], 'BeforeWorkitemDelete')
-        self.assertEqual(fired[2], 'BeforeMessageProcessed')  # auto
-        self.assertEqual(fired[3], 'BeforePomodoroComplete')
-        self.assertEqual(fired[4], 'AfterPomodoroComplete')
-        self.assertEqual(fired[5], 'AfterMessageProcessed')  # auto
-        self.assertEqual(fired[6], 'AfterWorkitemDelete')
-        self.assertEqual(fired[7], 'AfterMessageProcessed')
-
-    def test_events_complete_workitem(self):
-        fired = list()
-
-        def on_event(event, **kwargs):
-            fired.append(event)
-            if event == 'BeforeWorkitemComplete' or event == 'AfterWorkitemComplete':
-                self.assertIn('workitem', kwargs)
-                self.assertTrue(type(kwargs['workitem']) is Workitem)
-                self.assertEqual(kwargs['workitem'].get_name(), 'First item')
-            elif event == 'BeforePomodoroComplete' or event == 'AfterPomodoroComplete':
-                self.assertIn('workitem', kwargs)
-                self.assertIn('target_state', kwargs)
-                self.assertTrue(type(kwargs['workitem']) is Workitem)
-                self.assertEqual(kwargs['workitem'].get_name(), 'First item')
-                self.assertEqual(kwargs['target_state'], 'canceled')
-
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First item'])
-        self.source.execute(CreateWorkitemStrategy, ['w12', 'b1', 'Second item'])
-        self.source.execute(AddPomodoroStrategy, ['w11', '2'])
-        self.source.execute(StartWorkStrategy, ['w11', '1', '1'])
-        self.source.auto_seal()
-        self.source.on('*', on_event)  # We only care about delete here
-        self.source.execute(CompleteWorkitemStrategy, ['w11', 'finished'])
-        self.source.auto_seal()
-        self.assertEqual(len(fired), 8)
-        self.assertEqual(fired[0], 'BeforeMessageProcessed')
-        self.assertEqual(fired[1], 'BeforeWorkitemComplete')
-        self.assertEqual(fired[2], 'BeforeMessageProcessed')  # auto
-        self.assertEqual(fired[3], 'BeforePomodoroComplete')
-        self.assertEqual(fired[4], 'AfterPomodoroComplete')
-        self.assertEqual(fired[5], 'AfterMessageProcessed')  # auto
-        self.assertEqual(fired[6], 'AfterWorkitemComplete')
-        self.assertEqual(fired[7], 'AfterMessageProcessed')
-
-    def test_events_rename_workitem(self):
-        fired = list()
-
-        def on_event(event, **kwargs):
-            fired.append(event)
-            if event == 'BeforeWorkitemRename' or event == 'AfterWorkitemRename':
-                self.assertIn('workitem', kwargs)
-                self.assertIn('old_name', kwargs)
-                self.assertIn('new_name', kwargs)
-                self.assertEqual(kwargs['old_name'], 'Before')
-                self.assertEqual(kwargs['new_name'], 'After')
-                self.assertTrue(type(kwargs['workitem']) is Workitem)
-
-        self._standard_backlog()
-        self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'Before'])
-        self.source.auto_seal()
-        self.source.on('*', on_event)
-        self.source.execute(RenameWorkitemStrategy, ['w11', 'After'])
-        self.source.auto_seal()
-        self.assertEqual(len(fired), 4)
-        self.assertEqual(fired[0], 'BeforeMessageProcessed')
-        self.assertEqual(fired[1], 'BeforeWorkitemRename')
-        self.assertEqual(fired[2], 'AfterWorkitemRename')
-        self.assertEqual(fired[3], 'AfterMessageProcessed')
+    def _record_events(self) -> list[tuple[str, dict]]:
+        fired = []
+        self.source.on('*', lambda event, **kwargs: fired.append((event, kwargs)))
+        return fired
+
+    def test_events(self):
+        # (description, preparation steps, the step we listen to, expected events, expected event parameters).
+        # Workitem parameters are checked by name.
+        cases = [
+            ('create',
+             [],
+             (CreateWorkitemStrategy, ['w11', 'b1', 'First workitem']),
+             ['BeforeMessageProcessed',
+              'BeforeWorkitemCreate',
+              'AfterWorkitemCreate',
+              'AfterMessageProcessed'],
+             {
+                 'BeforeWorkitemCreate': {
+                     'workitem_uid': 'w11',
+                     'backlog_uid': 'b1',
+                     'workitem_name': 'First workitem',
+                 },
+                 'AfterWorkitemCreate': {'workitem': 'First workitem'},
+             }),
+            ('delete',
+             [(CreateWorkitemStrategy, ['w11', 'b1', 'First item']),
+              (AddPomodoroStrategy, ['w11', '2']),
+              (CreateWorkitemStrategy, ['w12', 'b1', 'Second item']),
+              (AddPomodoroStrategy, ['w11', '2']),
+              (StartWorkStrategy, ['w11', '1', '1'])],
+             (DeleteWorkitemStrategy, ['w11']),
+             ['BeforeMessageProcessed',
+              'BeforeWorkitemDelete',
+              'BeforeMessageProcessed',  # auto
+              'BeforePomodoroComplete',
+              'AfterPomodoroComplete',
+              'AfterMessageProcessed',  # auto
+              'AfterWorkitemDelete',
+              'AfterMessageProcessed'],
+             {
+                 'BeforeWorkitemDelete': {'workitem': 'First item'},
+                 'AfterWorkitemDelete': {'workitem': 'First item'},
+                 'BeforePomodoroComplete': {'workitem': 'First item', 'target_state': 'canceled'},
+                 'AfterPomodoroComplete': {'workitem': 'First item', 'target_state': 'canceled'},
+             }),
+            ('complete',
+             [(CreateWorkitemStrategy, ['w11', 'b1', 'First item']),
+              (CreateWorkitemStrategy, ['w12', 'b1', 'Second item']),
+              (AddPomodoroStrategy, ['w11', '2']),
+              (StartWorkStrategy, ['w11', '1', '1'])],
+             (CompleteWorkitemStrategy, ['w11', 'finished']),
+             ['BeforeMessageProcessed',
+              'BeforeWorkitemComplete',
+              'BeforeMessageProcessed',  # auto
+              'BeforePomodoroComplete',
+              'AfterPomodoroComplete',
+              'AfterMessageProcessed',  # auto
+              'AfterWorkitemComplete',
+              'AfterMessageProcessed'],
+             {
+                 'BeforeWorkitemComplete': {'workitem': 'First item'},
+                 'AfterWorkitemComplete': {'workitem': 'First item'},
+                 'BeforePomodoroComplete': {'workitem': 'First item', 'target_state': 'canceled'},
+                 'AfterPomodoroComplete': {'workitem': 'First item', 'target_state': 'canceled'},
+             }),
+            ('rename',
+             [(CreateWorkitemStrategy, ['w11', 'b1', 'Before'])],
+             (RenameWorkitemStrategy, ['w11', 'After']),
+             ['BeforeMessageProcessed',
+              'BeforeWorkitemRename',
+              'AfterWorkitemRename',
+              'AfterMessageProcessed'],
+             {
+                 'BeforeWorkitemRename': {'old_name': 'Before', 'new_name': 'After'},
+                 'AfterWorkitemRename': {'old_name': 'Before', 'new_name': 'After'},
+             }),
+        ]
+        for description, steps, (strategy, params), expected_events, expected_params in cases:
+            with self.subTest(description):
+                self._start_source()
+                for step_strategy, step_params in steps:
+                    self.source.execute(step_strategy, step_params)
+                self.source.auto_seal()
+
+                fired = self._record_events()  # We only care about the last step here
+                self.source.execute(strategy, params)
+                self.source.auto_seal()
+
+                self.assertEqual([event for event, _ in fired], expected_events)
+                for event, kwargs in fired:
+                    if 'workitem' in kwargs:
+                        self.assertTrue(type(kwargs['workitem']) is Workitem)
+                    for name, value in expected_params.get(event, {}).items():
+                        self.assertIn(name, kwargs)
+                        actual = kwargs[name]
+                        if name == 'workitem':
+                            actual = actual.get_name()
+                        self.assertEqual(actual, value)
 
     # Reordering tests:
     # - Positive test -- move up and down
@@ -370,7 +344,7 @@ class TestWorkitems(TestCase):
     # - Events
 
     def _create_workitems_for_reorder_tests(self):
-        _, backlog = self._standard_backlog()
+        backlog = self.backlog
         self.source.execute(CreateWorkitemStrategy, ['w11', 'b1', 'First workitem'])
         self.source.execute(CreateWorkitemStrategy, ['w12', 'b1', 'Second workitem'])
         self.source.execute(CreateWorkitemStrategy, ['w13', 'b1', 'Third workitem'])
@@ -20,13 +20,20 @@ from fk.qt.audio_player import AudioPlayer
 from fk.qt.qt_timer import QtTimer
 from fk.tools.minimal_common import MinimalCommon
 
-mc = MinimalCommon()
 
-pomodoro_timer = PomodoroTimer(QtTimer("Pomodoro Tick"), QtTimer("Pomodoro Transition"), mc.get_settings(), mc.get_app().get_source_holder())
-audio = AudioPlayer(mc.get_window(), mc.get_app().get_source_holder(), mc.get_settings(), pomodoro_timer)
+def main():
+    mc = MinimalCommon()
 
-button = QPushButton(mc.get_window())
-button.setText('Audio')
-mc.get_window().setCentralWidget(button)
+    pomodoro_timer = PomodoroTimer(QtTimer("Pomodoro Tick"), QtTimer("Pomodoro Transition"), mc.get_settings(), mc.get_app().get_source_holder())
+    # Not used directly, but has to stay referenced while main_loop() runs
+    audio = AudioPlayer(mc.get_window(), mc.get_app().get_source_holder(), mc.get_settings(), pomodoro_timer)
 
-mc.main_loop()
+    button = QPushButton(mc.get_window())
+    button.setText('Audio')
+    mc.get_window().setCentralWidget(button)
+
+    mc.main_loop()
+
+
+if __name__ == '__main__':
+    main()
@@ -20,24 +20,29 @@ from fk.qt.qt_timer import QtTimer
 from fk.qt.timer_widget import TimerWidget
 from fk.tools.minimal_common import MinimalCommon
 
-mc = MinimalCommon()
-
-pomodoro_timer = PomodoroTimer(QtTimer("Pomodoro Tick"), QtTimer("Pomodoro Transition"), mc.get_settings(), mc.get_app().get_source_holder())
-FocusWidget.define_actions(mc.get_actions())
-
-action = mc.get_actions()['focus.voidPomodoro']
-
-timer = TimerWidget(mc.get_window(),
-                    'timer',
-                    #mc.get_settings().get('Application.focus_flavor'),
-                    'minimal',
-                    None,
-                    500)
-timer.set_values(0 * 25 * 60 * 1000,
-                 25 * 60 * 1000,
-                 None,
-                 None,
-                 'ready')
-mc.get_window().setCentralWidget(timer)
-
-mc.main_loop()
+
+def main():
+    mc = MinimalCommon()
+
+    # Not used directly, but has to stay referenced while main_loop() runs
+    pomodoro_timer = PomodoroTimer(QtTimer("Pomodoro Tick"), QtTimer("Pomodoro Transition"), mc.get_settings(), mc.get_app().get_source_holder())
+    FocusWidget.define_actions(mc.get_actions())
+
+    timer = TimerWidget(mc.get_window(),
+                        'timer',
+                        #mc.get_settings().get('Application.focus_flavor'),
+                        'minimal',
+                        None,
+                        500)
+    timer.set_values(0 * 25 * 60 * 1000,
+                     25 * 60 * 1000,
+                     None,
+                     None,
+                     'ready')
+    mc.get_window().setCentralWidget(timer)
+
+    mc.main_loop()
+
+
+if __name__ == '__main__':
+    main()